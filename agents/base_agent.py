@@ -15,7 +15,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """
     Universal message format across all platforms.
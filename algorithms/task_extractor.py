@@ -11,6 +11,14 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import List, Optional, Tuple
 
+# Sentence boundaries used by pattern-based extraction
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]\s+")
+
+
+def _any_of(keywords) -> re.Pattern:
+    """Compile a pattern matching any keyword as a plain substring."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
 
 class TaskPriority(Enum):
     """Task priority levels"""
@@ -21,7 +29,7 @@ class TaskPriority(Enum):
     URGENT = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedTask:
     """Represents an extracted task"""
 
@@ -111,6 +119,9 @@ class TaskExtractor:
         "soon": 0.6,
     }
 
+    # Words that mention a deadline without necessarily stating one
+    DEADLINE_INDICATORS = ("deadline", "by", "before", "due", "until")
+
     # Time expressions for deadline extraction
     TIME_PATTERNS = [
         (r"by\s+(\w+day)", "by_weekday"),
@@ -126,12 +137,24 @@ class TaskExtractor:
         (r"(\w+)\s+(\d{1,2})", "month_day"),
     ]
 
+    # Compiled once at class load and shared by all instances
+    COMPILED_TIME_PATTERNS = [
+        (re.compile(pattern, re.IGNORECASE), ptype) for pattern, ptype in TIME_PATTERNS
+    ]
+
+    # Single-pass equivalents of `any(keyword in text for keyword in ...)`
+    TASK_INDICATOR_PATTERN = _any_of(ACTION_VERBS | set(MODAL_VERBS))
+    ACTION_VERB_PATTERN = _any_of(ACTION_VERBS)
+    MODAL_VERB_PATTERN = _any_of(MODAL_VERBS)
+    URGENCY_PATTERN = _any_of(URGENCY_KEYWORDS)
+    DEADLINE_PATTERN = _any_of(DEADLINE_INDICATORS)
+
+    # Obligation and urgency weights scored together by _calculate_priority
+    PRIORITY_WEIGHTS = tuple(MODAL_VERBS.items()) + tuple(URGENCY_KEYWORDS.items())
+
     def __init__(self):
         """Initialize task extractor"""
-        self.compiled_patterns = [
-            (re.compile(pattern, re.IGNORECASE), ptype)
-            for pattern, ptype in self.TIME_PATTERNS
-        ]
+        self.compiled_patterns = self.COMPILED_TIME_PATTERNS
 
     def extract_tasks(
         self, text: str, llm_analysis: Optional[dict] = None
@@ -147,16 +170,19 @@ class TaskExtractor:
             List of extracted tasks with priorities and deadlines
         """
         tasks = []
+        # Keyword matching is case-insensitive; lowercase the message once
+        # and hand the copy down instead of re-lowering it per helper call
+        text_lower = text.lower()
 
         # If LLM already extracted tasks, structure them
         if llm_analysis and "tasks" in llm_analysis:
             for llm_task in llm_analysis["tasks"]:
-                task = self._structure_llm_task(llm_task, text)
+                task = self._structure_llm_task(llm_task, text, text_lower)
                 if task:
                     tasks.append(task)
 
         # Also do pattern-based extraction as backup/supplement
-        pattern_tasks = self._extract_by_patterns(text)
+        pattern_tasks = self._extract_by_patterns(text, text_lower)
 
         # Merge and deduplicate tasks
         tasks = self._merge_tasks(tasks, pattern_tasks)
@@ -164,7 +190,7 @@ class TaskExtractor:
         return tasks
 
     def _structure_llm_task(
-        self, llm_task: str, original_text: str
+        self, llm_task: str, original_text: str, text_lower: str
     ) -> Optional[ExtractedTask]:
         """
         Structure a task identified by LLM with priority and deadline.
@@ -172,6 +198,7 @@ class TaskExtractor:
         Args:
             llm_task: Task description from LLM
             original_text: Original message text
+            text_lower: Lowercased original_text
 
         Returns:
             Structured ExtractedTask or None
@@ -183,10 +210,10 @@ class TaskExtractor:
         description = llm_task.strip().strip("-•*").strip()
 
         # Calculate priority from text analysis
-        priority = self._calculate_priority(description, original_text)
+        priority = self._calculate_priority(description.lower(), text_lower)
 
         # Extract deadline if mentioned
-        deadline = self._extract_deadline(original_text)
+        deadline = self._extract_deadline(text_lower)
 
         # Calculate confidence (high for LLM-identified tasks)
         confidence = 0.85
@@ -199,24 +226,26 @@ class TaskExtractor:
             source_text=original_text[:100],
         )
 
-    def _extract_by_patterns(self, text: str) -> List[ExtractedTask]:
+    def _extract_by_patterns(self, text: str, text_lower: str) -> List[ExtractedTask]:
         """
         Extract tasks using pattern matching (backup method).
 
         Args:
             text: Message text
+            text_lower: Lowercased message text
 
         Returns:
             List of extracted tasks
         """
         tasks = []
-        sentences = re.split(r"[.!?]\s+", text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
 
         for sentence in sentences:
-            if self._is_task_sentence(sentence):
-                priority = self._calculate_priority(sentence, text)
-                deadline = self._extract_deadline(sentence)
-                confidence = self._calculate_confidence(sentence)
+            sentence_lower = sentence.lower()
+            if self._is_task_sentence(sentence_lower):
+                priority = self._calculate_priority(sentence_lower, text_lower)
+                deadline = self._extract_deadline(sentence_lower)
+                confidence = self._calculate_confidence(sentence_lower)
 
                 task = ExtractedTask(
                     description=sentence.strip(),
@@ -234,49 +263,36 @@ class TaskExtractor:
         Check if sentence likely contains a task.
 
         Args:
-            sentence: Text to analyze
+            sentence: Lowercased text to analyze
 
         Returns:
             True if sentence appears to contain a task
         """
-        sentence_lower = sentence.lower()
-
-        # Check for action verbs
-        has_action = any(verb in sentence_lower for verb in self.ACTION_VERBS)
-
-        # Check for modal verbs
-        has_modal = any(modal in sentence_lower for modal in self.MODAL_VERBS)
-
-        # Check for command form (imperative)
-        starts_with_action = any(
-            sentence_lower.strip().startswith(verb) for verb in self.ACTION_VERBS
-        )
-
-        return has_action or has_modal or starts_with_action
+        # Any action or modal verb; a sentence opening with an action verb
+        # (imperative form) is covered by the same search
+        return self.TASK_INDICATOR_PATTERN.search(sentence) is not None
 
     def _calculate_priority(self, task_text: str, full_context: str) -> TaskPriority:
         """
         Calculate task priority based on keywords and context.
 
         Args:
-            task_text: The task description
-            full_context: Full message context
+            task_text: The task description, lowercased
+            full_context: Full message context, lowercased
 
         Returns:
             TaskPriority level
         """
         score = 0.0
-        combined_text = (task_text + " " + full_context).lower()
-
-        # Check for modal verbs (obligation)
-        for modal, weight in self.MODAL_VERBS.items():
-            if modal in combined_text:
-                score += weight
+        combined_text = task_text + " " + full_context
 
-        # Check for urgency keywords
-        for keyword, weight in self.URGENCY_KEYWORDS.items():
+        # Check for modal verbs (obligation) and urgency keywords. Weights
+        # are positive, so once the score is urgent nothing can lower it
+        for keyword, weight in self.PRIORITY_WEIGHTS:
             if keyword in combined_text:
                 score += weight
+                if score >= 1.5:
+                    return TaskPriority.URGENT
 
         # Check for deadline mentions
         if self._has_deadline_mention(combined_text):
@@ -293,25 +309,23 @@ class TaskExtractor:
             return TaskPriority.LOW
 
     def _has_deadline_mention(self, text: str) -> bool:
-        """Check if text mentions a deadline"""
-        deadline_indicators = ["deadline", "by", "before", "due", "until"]
-        return any(indicator in text.lower() for indicator in deadline_indicators)
+        """Check if lowercased text mentions a deadline"""
+        return self.DEADLINE_PATTERN.search(text) is not None
 
     def _extract_deadline(self, text: str) -> Optional[datetime]:
         """
         Extract deadline from text using pattern matching.
 
         Args:
-            text: Text to search for deadline
+            text: Lowercased text to search for deadline
 
         Returns:
             Datetime of deadline or None
         """
-        text_lower = text.lower()
         now = datetime.now()
 
         for pattern, ptype in self.compiled_patterns:
-            match = pattern.search(text_lower)
+            match = pattern.search(text)
             if match:
                 return self._parse_deadline_match(match, ptype, now)
 
@@ -382,28 +396,27 @@ class TaskExtractor:
         Calculate confidence that this is actually a task.
 
         Args:
-            sentence: Sentence to analyze
+            sentence: Lowercased sentence to analyze
 
         Returns:
             Confidence score 0.0-1.0
         """
         confidence = 0.0
-        sentence_lower = sentence.lower()
 
         # Action verb presence
-        if any(verb in sentence_lower for verb in self.ACTION_VERBS):
+        if self.ACTION_VERB_PATTERN.search(sentence):
             confidence += 0.4
 
         # Modal verb presence
-        if any(modal in sentence_lower for modal in self.MODAL_VERBS):
+        if self.MODAL_VERB_PATTERN.search(sentence):
             confidence += 0.3
 
         # Urgency keyword presence
-        if any(keyword in sentence_lower for keyword in self.URGENCY_KEYWORDS):
+        if self.URGENCY_PATTERN.search(sentence):
             confidence += 0.2
 
         # Deadline mention
-        if self._has_deadline_mention(sentence_lower):
+        if self._has_deadline_mention(sentence):
             confidence += 0.1
 
         return min(confidence, 1.0)
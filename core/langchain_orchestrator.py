@@ -78,7 +78,9 @@ class LangChainOrchestrator:
         self.processed_count = 0
         self.last_processed = None
 
-        logger.info(f"LangChainOrchestrator initialized with memory_type={memory_type}")
+        logger.info(
+            "LangChainOrchestrator initialized with memory_type=%s", memory_type
+        )
 
     async def initialize(self) -> None:
         """
@@ -141,7 +143,7 @@ class LangChainOrchestrator:
         if not self.initialized:
             await self.initialize()
 
-        logger.info(f"Processing message: {message.id} from {message.sender}")
+        logger.info("Processing message: %s from %s", message.id, message.sender)
 
         # Step 1: Build input context (placeholder)
         context = await self._build_context(message)
@@ -226,7 +228,7 @@ class LangChainOrchestrator:
             result: Processing result
         """
         # Placeholder - will use memory system when implemented
-        logger.info(f"Would store interaction for message {message.id} in memory")
+        logger.info("Would store interaction for message %s in memory", message.id)
 
     async def make_decision(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
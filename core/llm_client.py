@@ -7,14 +7,157 @@ The LLM serves as the central brain for decision-making, analysis, and generatio
 
 import asyncio
 import json
+import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, NamedTuple, Optional, Protocol, Tuple
 
 import aiohttp
 
+from core.serialization import dumps, loads
 
-@dataclass
+# Static instructions go in the system prompt so every request shares a
+# byte-identical prefix (lets the server reuse its prompt/KV cache); only
+# the per-call data goes in the prompt itself
+INTENT_SYSTEM_PROMPT = """You are the brain of AutoReturn, a communication automation assistant.
+Analyze the user command and determine:
+- Action: what they want to do (send, fetch, create, delete, update, summarize, search)
+- Target: which service (gmail, slack, task, notification)
+- Parameters: extract recipients, subject, content, filters, etc.
+- Confidence: how certain you are (0.0 to 1.0)
+
+Respond in valid JSON format only:
+{"action": "...", "target": "...", "parameters": {}, "confidence": 0.95}"""
+
+ANALYSIS_SYSTEM_PROMPT = """Analyze the message and provide insights:
+- Sentiment: positive/negative/neutral (-1.0 to 1.0)
+- Urgency: how urgent (0-10 scale)
+- Priority: overall priority (0-100)
+- Tone: URGENT/NEGATIVE/POSITIVE/NEUTRAL
+- Summary: One concise sentence summarizing the key point
+- Tasks: Any action items found (as array)
+- Requires Response: true/false if sender expects a reply
+
+Respond in valid JSON format only:
+{"sentiment": 0.5, "urgency": 5, "priority": 50, "tone": "NEUTRAL", "summary": "...", "tasks": [], "requires_response": false}"""
+
+SUMMARY_SYSTEM_PROMPT = """You are an intelligent assistant for WorkEase.
+Summarize the message in ONE concise sentence. Capture the key point, sender intent, and any urgency."""
+
+TASKS_SYSTEM_PROMPT = """You are the WorkEase task extraction assistant.
+From the text, extract ALL actionable tasks as a bullet list.
+Only include clear, specific tasks. Ignore non-actionable information."""
+
+DRAFT_SYSTEM_PROMPT = """Generate an appropriate reply to the message.
+Match the tone of the original sender.
+Address all key points mentioned.
+Keep it concise and professional."""
+
+# Line prefixes marking an item in the LLM's task bullet list
+_BULLETS = ("-", "•", "*")
+
+# Parsed intents kept per command template (see OllamaLLMClient.understand_intent)
+INTENT_CACHE_SIZE = 256
+
+# Quoted strings, email addresses and numbers vary between otherwise identical
+# commands, so they are slotted out of the intent cache key
+_SLOT_RE = re.compile(
+    r"\"[^\"]*\"|'[^']*'|[\w.+-]+@[\w-]+(?:\.[\w-]+)+|\b\d+(?:\.\d+)?\b"
+)
+
+
+# Message sections of batched orchestrator prompts, and the label the
+# message content follows (see MockLLMClient.generate)
+_MOCK_MESSAGE_RE = re.compile(r"^--- MESSAGE \d+ ---$", re.MULTILINE)
+_MOCK_CONTENT_RE = re.compile(r"^(?:Content: |FULL MESSAGE CONTENT:\n)", re.MULTILINE)
+
+
+# Short, fully specified commands resolved without an LLM call. The pattern
+# must match the whole command so nothing the LLM would extract is dropped;
+# qualifiers such as "new" or "latest" are filters, so they go to the LLM
+_FAST_INTENT_RE = re.compile(
+    r"(?:fetch|get|check|show|read)\s+(?:my\s+)?"
+    r"(?P<target>gmail|emails?|mail|inbox|slack)(?:\s+messages)?[.!]?",
+    re.IGNORECASE,
+)
+_FAST_TARGETS = {"emails": "gmail", "email": "gmail", "mail": "gmail", "inbox": "gmail"}
+
+
+class _Slot(NamedTuple):
+    """Placeholder for a slot value inside cached intent parameters."""
+
+    index: int
+    kind: type
+
+
+def _template_command(command: str) -> Tuple[str, List[str]]:
+    """
+    Replace slot values in a command with placeholders.
+
+    Returns:
+        Whitespace-normalized template and the slot values, in order
+    """
+    slots: List[str] = []
+
+    def _slot(match: re.Match) -> str:
+        slots.append(match.group(0).strip("\"'"))
+        return f"<SLOT_{len(slots) - 1}>"
+
+    template = _SLOT_RE.sub(_slot, command)
+    return " ".join(template.split()), slots
+
+
+def _to_template(value: Any, slots: List[str], used: set) -> Any:
+    """
+    Swap slot values in parsed intent parameters for placeholders.
+
+    Raises:
+        ValueError: If a slot value only appears inside a longer string,
+            since it could not be swapped back safely
+    """
+    if isinstance(value, str):
+        for i, slot in enumerate(slots):
+            if value == slot:
+                used.add(i)
+                return _Slot(i, str)
+            if slot and slot.lower() in value.lower():
+                raise ValueError(f"Slot value embedded in parameter: {value}")
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        for i, slot in enumerate(slots):
+            try:
+                if float(slot) == value:
+                    used.add(i)
+                    return _Slot(i, type(value))
+            except ValueError:
+                continue
+        return value
+    if isinstance(value, dict):
+        return {k: _to_template(v, slots, used) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_template(v, slots, used) for v in value]
+    return value
+
+
+def _fill_template(value: Any, slots: List[str]) -> Any:
+    """
+    Inverse of _to_template: build fresh parameters for the given slots.
+
+    Raises:
+        ValueError: If a slot value can't be converted to the type cached for
+            it (e.g. "7.5" where the cached intent had an int)
+    """
+    if isinstance(value, _Slot):
+        return value.kind(slots[value.index])
+    if isinstance(value, dict):
+        return {k: _fill_template(v, slots) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill_template(v, slots) for v in value]
+    return value
+
+
+@dataclass(slots=True)
 class Intent:
     """Represents parsed user intent."""
 
@@ -25,7 +168,7 @@ class Intent:
     raw_command: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageAnalysis:
     """Represents LLM analysis of a message."""
 
@@ -49,6 +192,19 @@ class LLMClient(ABC):
         """Initialize the LLM client and verify connection."""
         pass
 
+    @abstractmethod
+    async def generate(self, prompt: str) -> str:
+        """
+        Generate a raw completion for a prompt.
+
+        Args:
+            prompt: The full prompt, instructions included
+
+        Returns:
+            Generated text response
+        """
+        pass
+
     @abstractmethod
     async def understand_intent(
         self, user_input: str, context: Optional[List[Dict]] = None
@@ -157,6 +313,9 @@ class OllamaLLMClient(LLMClient):
         self.timeout = timeout
         self.session: Optional[aiohttp.ClientSession] = None
 
+        # LRU of (command template, context) -> (action, target, params, confidence)
+        self._intent_cache: OrderedDict = OrderedDict()
+
     async def initialize(self) -> None:
         """Initialize HTTP session and verify Ollama is running."""
         self.session = aiohttp.ClientSession()
@@ -221,29 +380,56 @@ class OllamaLLMClient(LLMClient):
         except asyncio.TimeoutError:
             raise TimeoutError(f"LLM request timed out after {self.timeout}s")
 
+    async def generate(self, prompt: str) -> str:
+        """Generate a raw completion; the prompt carries its own instructions."""
+        return await self._generate(prompt)
+
     async def understand_intent(
         self, user_input: str, context: Optional[List[Dict]] = None
     ) -> Intent:
         """Analyze user command and determine intent using LLM."""
+        match = _FAST_INTENT_RE.fullmatch(user_input.strip())
+        if match:
+            target = match.group("target").lower()
+            return Intent(
+                action="fetch",
+                target=_FAST_TARGETS.get(target, target),
+                parameters={},
+                confidence=0.95,
+                raw_command=user_input,
+            )
+
         context_str = ""
         if context:
             context_str = "\nRecent context:\n" + "\n".join(
                 [f"- {c.get('summary', '')}" for c in context[:3]]
             )
 
-        You are the brain of AutoReturn, a communication automation assistant.
-Analyze this user command and determine:
-- Action: what they want to do (send, fetch, create, delete, update, summarize, search)
-- Target: which service (gmail, slack, task, notification)
-- Parameters: extract recipients, subject, content, filters, etc.
-- Confidence: how certain you are (0.0 to 1.0)
-
-User command: "{user_input}"{context_str}
+        # Repeated commands (modulo quoted text, emails and numbers) reuse the
+        # previously parsed intent instead of another LLM round-trip
+        template, slots = _template_command(user_input)
+        cache_key = (template, context_str)
+        cached = self._intent_cache.get(cache_key)
+        if cached is not None:
+            action, target, params, confidence = cached
+            try:
+                parameters = _fill_template(params, slots)
+            except ValueError:
+                # Same template, different kind of value: ask the LLM
+                parameters = None
+            if parameters is not None:
+                self._intent_cache.move_to_end(cache_key)
+                return Intent(
+                    action=action,
+                    target=target,
+                    parameters=parameters,
+                    confidence=confidence,
+                    raw_command=user_input,
+                )
 
-Respond in valid JSON format only:
-{{"action": "...", "target": "...", "parameters": {{}}, "confidence": 0.95}}"""
+        prompt = f'User command: "{user_input}"{context_str}'
 
-        response = await self._generate(prompt)
+        response = await self._generate(prompt, INTENT_SYSTEM_PROMPT)
 
         # Parse JSON response
         try:
@@ -252,14 +438,16 @@ Respond in valid JSON format only:
             json_end = response.rfind("}") + 1
             if json_start != -1 and json_end > json_start:
                 json_str = response[json_start:json_end]
-                data = json.loads(json_str)
-                return Intent(
+                data = loads(json_str)
+                intent = Intent(
                     action=data.get("action", "unknown"),
                     target=data.get("target", "unknown"),
                     parameters=data.get("parameters", {}),
                     confidence=float(data.get("confidence", 0.5)),
                     raw_command=user_input,
                 )
+                self._cache_intent(cache_key, slots, intent)
+                return intent
         except json.JSONDecodeError:
             pass
 
@@ -272,27 +460,40 @@ Respond in valid JSON format only:
             raw_command=user_input,
         )
 
+    def _cache_intent(
+        self, cache_key: Tuple[str, str], slots: List[str], intent: Intent
+    ) -> None:
+        """Remember a parsed intent if its parameters can be re-slotted."""
+        used: set = set()
+        try:
+            params = _to_template(intent.parameters, slots, used)
+        except ValueError:
+            return
+        # A slot the parameters don't carry verbatim may still have shaped
+        # them (e.g. rephrased); such intents are not safe to reuse
+        if len(used) != len(slots):
+            return
+
+        self._intent_cache[cache_key] = (
+            intent.action,
+            intent.target,
+            params,
+            intent.confidence,
+        )
+        if len(self._intent_cache) > INTENT_CACHE_SIZE:
+            self._intent_cache.popitem(last=False)
+
     async def analyze_message(
         self, message_content: str, sender: str, subject: str = ""
     ) -> MessageAnalysis:
         """Analyze incoming message using LLM."""
-        prompt = f"""Analyze this message and provide insights:
-- Sentiment: positive/negative/neutral (-1.0 to 1.0)
-- Urgency: how urgent (0-10 scale)
-- Priority: overall priority (0-100)
-- Tone: URGENT/NEGATIVE/POSITIVE/NEUTRAL
-- Summary: One concise sentence summarizing the key point
-- Tasks: Any action items found (as array)
-- Requires Response: true/false if sender expects a reply
-
-Sender: {sender}
-Subject: {subject}
-Message: "{message_content}"
-
-Respond in valid JSON format only:
-{{"sentiment": 0.5, "urgency": 5, "priority": 50, "tone": "NEUTRAL", "summary": "...", "tasks": [], "requires_response": false}}"""
+        prompt = (
+            f"Sender: {sender}\n"
+            f"Subject: {subject}\n"
+            f'Message: "{message_content}"'
+        )
 
-        response = await self._generate(prompt)
+        response = await self._generate(prompt, ANALYSIS_SYSTEM_PROMPT)
 
         # Parse JSON response
         try:
@@ -300,7 +501,7 @@ Respond in valid JSON format only:
             json_end = response.rfind("}") + 1
             if json_start != -1 and json_end > json_start:
                 json_str = response[json_start:json_end]
-                data = json.loads(json_str)
+                data = loads(json_str)
                 return MessageAnalysis(
                     sentiment=float(data.get("sentiment", 0.0)),
                     urgency=int(data.get("urgency", 5)),
@@ -328,37 +529,33 @@ Respond in valid JSON format only:
         self, message_content: str, source: str, sender: str
     ) -> str:
         """Generate concise AI summary of a message."""
-        prompt = f"""You are an intelligent assistant for WorkEase.
-Summarize this {source} message in ONE concise sentence. Capture the key point, sender intent, and any urgency:
-
+        prompt = f"""Source: {source}
 Sender: {sender}
 Content: {message_content}
 
 Summary:"""
 
-        summary = await self._generate(prompt)
+        summary = await self._generate(prompt, SUMMARY_SYSTEM_PROMPT)
         # Ensure it's one sentence, take first sentence if multiple
         return (
-            summary.split(".")[0].strip() + "." if summary else "No summary available."
+            summary.partition(".")[0].strip() + "."
+            if summary
+            else "No summary available."
         )
 
     async def extract_tasks(self, text: str) -> List[str]:
         """Extract actionable tasks from text using LLM."""
-        prompt = f"""You are the WorkEase task extraction assistant.
-From this text, extract ALL actionable tasks as a bullet list.
-Only include clear, specific tasks. Ignore non-actionable information.
-
-Text: {text}
+        prompt = f"""Text: {text}
 
 Tasks (bullet list):"""
 
-        response = await self._generate(prompt)
+        response = await self._generate(prompt, TASKS_SYSTEM_PROMPT)
 
         # Parse bullet list
         tasks = []
         for line in response.split("\n"):
             line = line.strip()
-            if line.startswith("-") or line.startswith("•") or line.startswith("*"):
+            if line.startswith(_BULLETS):
                 task = line.lstrip("-•* ").strip()
                 if task:
                     tasks.append(task)
@@ -367,18 +564,13 @@ Tasks (bullet list):"""
 
     async def generate_draft(self, original_message: str, context: str = "") -> str:
         """Generate appropriate reply draft using LLM."""
-        context_note = f"\nContext: {context}" if context else ""
-
-        prompt = f"""Generate an appropriate reply to this message.
-Match the tone of the original sender.
-Address all key points mentioned.
-Keep it concise and professional.{context_note}
+        context_note = f"Context: {context}\n\n" if context else ""
 
-Original message: "{original_message}"
+        prompt = f"""{context_note}Original message: "{original_message}"
 
 Generate reply:"""
 
-        draft = await self._generate(prompt)
+        draft = await self._generate(prompt, DRAFT_SYSTEM_PROMPT)
         return draft if draft else "Thank you for your message."
 
     async def close(self) -> None:
@@ -397,6 +589,45 @@ class MockLLMClient(LLMClient):
         """No initialization needed for mock."""
         pass
 
+    async def generate(self, prompt: str) -> str:
+        """
+        Canned JSON analysis of the message(s) in an orchestrator prompt.
+
+        Batched prompts get one "--- RESULT N ---" block per message.
+        """
+        sections = _MOCK_MESSAGE_RE.split(prompt)
+        if len(sections) == 1:
+            return await self._mock_analysis(prompt)
+        results = [
+            f"--- RESULT {i} ---\n{await self._mock_analysis(section)}"
+            for i, section in enumerate(sections[1:], 1)
+        ]
+        return "\n".join(results)
+
+    async def _mock_analysis(self, prompt: str) -> str:
+        """Keyword-based analysis of the message content at the end of a prompt."""
+        content = _MOCK_CONTENT_RE.split(prompt)[-1].strip()
+        lower = content.lower()
+        urgent = any(word in lower for word in ["urgent", "asap", "immediately"])
+        polite = any(word in lower for word in ["please", "thank"])
+        tasks = await self.extract_tasks(content)
+        return dumps(
+            {
+                "summary": content[:100],
+                "key_points": [],
+                "sentiment": "positive" if polite else "neutral",
+                "urgency": 8 if urgent else 5,
+                "tasks": [
+                    {
+                        "description": task,
+                        "priority": 8 if urgent else 5,
+                        "deadline": None,
+                    }
+                    for task in tasks
+                ],
+            }
+        )
+
     async def understand_intent(
         self, user_input: str, context: Optional[List[Dict]] = None
     ) -> Intent:
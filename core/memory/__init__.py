@@ -12,9 +12,21 @@ The appropriate provider can be selected through configuration, allowing
 the orchestrator to maintain conversation history and context across interactions.
 """
 
+import importlib
+
 from core.memory.context_provider import ContextProvider
-from core.memory.langchain_memory import LangChainMemoryProvider
-from core.memory.rag_provider import ChromaRAGProvider, RAGProvider
+
+# Providers are imported on first access (PEP 562) so that using one of them,
+# or just the ContextProvider protocol, doesn't load every backend's
+# dependencies (numpy, aiosqlite, LangChain)
+_LAZY = {
+    "LangChainMemoryProvider": "core.memory.langchain_memory",
+    "RAGProvider": "core.memory.rag_provider",
+    "ChromaRAGProvider": "core.memory.rag_provider",
+    "SummaryStore": "core.memory.summary_store",
+    "InMemorySummaryStore": "core.memory.summary_store",
+    "SQLiteSummaryStore": "core.memory.summary_store",
+}
 
 # Re-export components for easier imports
 __all__ = [
@@ -22,4 +34,20 @@ __all__ = [
     "LangChainMemoryProvider",
     "RAGProvider",
     "ChromaRAGProvider",
+    "SummaryStore",
+    "InMemorySummaryStore",
+    "SQLiteSummaryStore",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
@@ -0,0 +1,139 @@
+"""
+Similarity kernels for the RAG provider.
+
+The dot-product scan uses SimSIMD's SIMD kernels when it is installed,
+a Numba JIT-compiled loop when that is, and a plain NumPy matrix-vector
+product otherwise. All expect the stored rows and the query to be
+normalized already, so the dot product is the cosine similarity.
+
+With SimSIMD the query is cast to the matrix dtype, so int8 and float16
+rows are multiplied natively instead of being widened to float32. int8
+rows hold round(x * 127); the query is quantized the same way and the
+scores divided back by 127, so they match the other kernels' scale.
+
+Without SimSIMD, rows that are not float32 are widened a block at a time
+into one reused float32 buffer before the NumPy product, rather than
+having NumPy cast the whole matrix (or multiply in slow float16). float16
+always takes that path, since Numba has no float16 arithmetic.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    import simsimd
+except ImportError:  # SimSIMD is optional
+    simsimd = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional
+    njit = None
+
+# Quantization factor of int8 embedding rows, which hold round(x * INT8_SCALE)
+INT8_SCALE = 127.0
+
+# Rows widened to float32 per block by _blocked_scores (1.5 MiB at dim 384)
+_BLOCK_ROWS = 1024
+
+
+def _blocked_scores(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    n_rows = len(matrix)
+    scores = np.empty(n_rows, dtype=np.float32)
+    buf = np.empty((min(_BLOCK_ROWS, n_rows), matrix.shape[1]), dtype=np.float32)
+    for start in range(0, n_rows, _BLOCK_ROWS):
+        block = buf[: min(_BLOCK_ROWS, n_rows - start)]
+        block[...] = matrix[start : start + len(block)]
+        np.matmul(block, query, out=scores[start : start + len(block)])
+    return scores
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _dot_scores(matrix, query):
+        n_rows, dim = matrix.shape
+        scores = np.empty(n_rows, dtype=np.float32)
+        for i in prange(n_rows):
+            acc = np.float32(0.0)
+            for j in range(dim):
+                acc += matrix[i, j] * query[j]
+            scores[i] = acc
+        return scores
+
+else:
+
+    def _dot_scores(matrix, query):
+        if matrix.dtype != np.float32:
+            return _blocked_scores(matrix, query)
+        return matrix @ query
+
+
+def _simsimd_scores(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    if matrix.dtype == np.int8:
+        query = np.round(query * INT8_SCALE).astype(np.int8)
+    else:
+        query = query.astype(matrix.dtype)
+    scores = np.asarray(
+        simsimd.cdist(query[None, :], matrix, metric="dot"), dtype=np.float32
+    ).ravel()
+    if matrix.dtype == np.int8:
+        scores /= INT8_SCALE
+    return scores
+
+
+def _scores(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    if simsimd is not None and len(matrix):
+        return _simsimd_scores(np.ascontiguousarray(matrix), query)
+    if matrix.dtype == np.float16:
+        return _blocked_scores(matrix, query)
+    return _dot_scores(matrix, query)
+
+
+def normalize(vec: np.ndarray) -> np.ndarray:
+    """
+    Scale a float32 vector to unit length; zero vectors are returned as-is.
+
+    sqrt(v . v) is the same L2 norm np.linalg.norm computes, without its
+    argument validation and norm-type dispatch on every call.
+    """
+    norm = np.sqrt(np.dot(vec, vec))
+    return vec / norm if norm else vec
+
+
+def topk_cosine(
+    matrix: np.ndarray,
+    query: np.ndarray,
+    k: int,
+    mask: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k rows of `matrix` most similar to `query`.
+
+    Uses O(N) partial selection (argpartition) and only sorts the k
+    candidates for the final ordering.
+
+    Args:
+        matrix: (N, dim) matrix of pre-normalized row vectors
+        query: Normalized float32 query vector of length dim
+        k: Number of results to return
+        mask: Optional (N,) bool array; rows where it is False are skipped
+
+    Returns:
+        Tuple of (row indices, scores), best match first
+    """
+    scores = _scores(matrix, query)
+    if mask is not None:
+        scores[~mask] = -np.inf  # Sorts after every real score
+        k = min(k, int(np.count_nonzero(mask)))
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+    if k < len(scores):
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(len(scores))
+    idx = idx[np.argsort(-scores[idx], kind="stable")]
+    return idx, scores[idx]
@@ -0,0 +1,73 @@
+"""
+Structured distillation of interactions for AutoReturn memory.
+
+Instead of paraphrasing a whole exchange, interactions are reduced to:
+
+- decision: what was decided/answered (the only part an LLM may paraphrase)
+- exchange_core: verbatim key phrases quoted by the user
+- handles: verbatim technical tokens (file paths, flags, CONSTANT_NAMES)
+
+Keeping the exact tokens means keyword and semantic search still hit the
+same terms after memory has been compacted.
+"""
+
+import re
+from typing import Dict, Iterable, List
+
+# File names/paths, command-line flags, and upper-case identifiers
+_HANDLE_RE = re.compile(
+    r"[/\w.-]+\.\w+|(?<![\w-])--?[A-Za-z][\w-]*|\b[A-Z][A-Z0-9_]{2,}\b"
+)
+
+# Double-quoted or backtick-quoted spans
+_KEY_PHRASE_RE = re.compile(r'"([^"\n]+)"|`([^`\n]+)`')
+
+
+def _dedupe(items: Iterable[str]) -> List[str]:
+    """Drop repeats while keeping first-seen order."""
+    return list(dict.fromkeys(items))
+
+
+def extract_handles(text: str) -> List[str]:
+    """
+    Find technical handles that must survive compaction verbatim.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Unique handles in order of first appearance
+    """
+    return _dedupe(_HANDLE_RE.findall(text))
+
+
+def extract_key_phrases(text: str) -> List[str]:
+    """
+    Find phrases the user quoted explicitly.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Unique quoted phrases in order of first appearance
+    """
+    return _dedupe(a or b for a, b in _KEY_PHRASE_RE.findall(text))
+
+
+def distill_interaction(user_text: str, action: str, response: str) -> Dict[str, str]:
+    """
+    Reduce an interaction to its structured record.
+
+    Args:
+        user_text: What the user said
+        action: Classified intent action
+        response: The system's response
+
+    Returns:
+        Dict with 'decision', 'exchange_core' and 'handles' strings
+    """
+    return {
+        "decision": f"{action}: {response}",
+        "exchange_core": " | ".join(extract_key_phrases(user_text)),
+        "handles": " ".join(extract_handles(f"{user_text}\n{response}")),
+    }
@@ -8,16 +8,68 @@ retention capabilities to the WorkEase orchestrator.
 Status: BASE IMPLEMENTATION - Ready for future expansion
 """
 
+import hashlib
+import logging
+import os
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from core.memory.distillation import extract_handles, extract_key_phrases
+from core.memory.summary_store import SQLiteSummaryStore, SummaryStore, summary_key
+from core.serialization import dumps, loads
+
 # These imports would be uncommented when implementing the full functionality
 # from langchain.memory import ConversationBufferMemory
 # from langchain.memory import ConversationSummaryMemory
 # from langchain.memory import ConversationSummaryBufferMemory
 # from langchain.llms.base import BaseLLM
 
+logger = logging.getLogger(__name__)
+
+
+CHECKPOINT_FILE = "checkpoint.json"
+MESSAGE_LOG_FILE = "messages.jsonl"
+SUMMARY_DB_FILE = "summaries.db"
+
+# The message log is rewritten with just the window's messages once it holds
+# this many times more lines than the window (or max_window_messages)
+LOG_COMPACT_FACTOR = 2
+
+# Bump when SUMMARY_PROMPT changes so cached summaries are not reused
+PROMPT_VERSION = "1"
+SUMMARY_PROMPT = (
+    "Progressively summarize the conversation, adding onto the previous "
+    "summary and returning a new summary.\n\n"
+    "Current summary:\n{summary}\n\n"
+    "New lines of conversation:\n{new_lines}\n\n"
+    "New summary:"
+)
+
+# Block fields written to the checkpoint (content lives in the message log)
+_CHECKPOINT_FIELDS = ("id", "role", "hash", "tokens", "timestamp", "summary")
+
+
+def _content_hash(text: str) -> str:
+    """Stable 128-bit content hash used to identify memory blocks."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _distill_block(content: str) -> Optional[Dict[str, List[str]]]:
+    """Verbatim phrases and handles of a message that must survive summarization."""
+    exchange_core = extract_key_phrases(content)
+    handles = extract_handles(content)
+    if not exchange_core and not handles:
+        return None
+    return {"exchange_core": exchange_core, "handles": handles}
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) for budget checks."""
+    return max(1, len(text) // 4)
+
 
 class LangChainMemoryProvider:
     """
@@ -40,6 +92,8 @@ class LangChainMemoryProvider:
         llm_model: Optional[str] = None,
         persist_directory: Optional[str] = "memory/langchain",
         summarize_old: bool = True,
+        summary_store: Optional[SummaryStore] = None,
+        max_window_messages: int = 100,
     ):
         """
         Initialize LangChain memory provider.
@@ -50,18 +104,262 @@ class LangChainMemoryProvider:
             llm_model: LLM model to use for summarization (required for summary types)
             persist_directory: Directory to persist memory between sessions
             summarize_old: Whether to summarize old messages when token limit is reached
+            summary_store: Cache for generated summaries (summary types only)
+                Default: SQLite store in persist_directory
+            max_window_messages: Maximum number of messages kept in the buffer.
+                Summary types summarize once this many are held instead of
+                dropping the oldest; without an LLM (set self.llm before
+                initialize) they drop the oldest like buffer memory
         """
         self.memory_type = memory_type
         self.max_tokens = max_tokens
         self.llm_model = llm_model
         self.persist_directory = persist_directory
         self.summarize_old = summarize_old
+        self.summary_store = summary_store
+        self._owns_summary_store = summary_store is None
+        self.max_window_messages = max_window_messages
 
         # Will be initialized in initialize()
         self.memory = None
         self.llm = None
         self.is_initialized = False
 
+        # Sliding window of message blocks (metadata + content) and running
+        # summary state. Only block metadata is checkpointed; content is kept
+        # in the append-only message log and reloaded on demand after a restart.
+        # When summarizing, the window only holds not-yet-summarized messages
+        # and has no maxlen (see initialize); summarization keeps it within
+        # max_window_messages.
+        self._window: deque = deque(maxlen=max_window_messages)
+        self._window_tokens = 0  # Running sum of the window's block tokens
+        self._log_lines = 0  # Messages in the log, live or not (see _compact_log)
+        self._next_block_id = 0
+        self._summary = ""
+        self._summary_key = ""  # Chained hash of every summarized message
+        self._summarized_upto = 0
+
+        # Verbatim vocabulary of summarized messages, kept out of the
+        # LLM-paraphrased summary so exact terms stay searchable. Dicts act
+        # as insertion-ordered sets: first-seen order, no duplicates
+        self._exchange_core: Dict[str, None] = {}
+        self._handles: Dict[str, None] = {}
+
+        # Per-memory-type behaviour, bound once in initialize()
+        self._format_context = None
+        self._make_room = None
+
+    @property
+    def _checkpoint_path(self) -> Path:
+        return Path(self.persist_directory) / CHECKPOINT_FILE
+
+    @property
+    def _log_path(self) -> Path:
+        return Path(self.persist_directory) / MESSAGE_LOG_FILE
+
+    def _write_checkpoint(self) -> None:
+        """
+        Atomically write block metadata and summary state to disk.
+
+        Writes to a temporary file and renames it over the checkpoint so a
+        crash mid-write never leaves a torn checkpoint behind.
+        """
+        checkpoint = {
+            "blocks": [
+                {key: block[key] for key in _CHECKPOINT_FIELDS}
+                for block in self._window
+            ],
+            "next_id": self._next_block_id,
+            "summary": self._summary,
+            "summary_key": self._summary_key,
+            "upto": self._summarized_upto,
+            "exchange_core": list(self._exchange_core),
+            "handles": list(self._handles),
+        }
+        tmp_path = self._checkpoint_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(dumps(checkpoint))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._checkpoint_path)
+
+    def _load_checkpoint(self) -> None:
+        """Restore block metadata and summary state from the last checkpoint."""
+        if not self._checkpoint_path.exists():
+            return
+
+        with open(self._checkpoint_path, encoding="utf-8") as f:
+            checkpoint = loads(f.read())
+
+        self._window = deque(
+            (dict(block, content=None) for block in checkpoint.get("blocks", [])),
+            maxlen=self._window.maxlen,
+        )
+        self._window_tokens = sum(block["tokens"] for block in self._window)
+        self._next_block_id = checkpoint.get("next_id", 0)
+        self._summary = checkpoint.get("summary", "")
+        self._summary_key = checkpoint.get("summary_key", "")
+        self._summarized_upto = checkpoint.get("upto", 0)
+        self._exchange_core = dict.fromkeys(checkpoint.get("exchange_core", []))
+        self._handles = dict.fromkeys(checkpoint.get("handles", []))
+
+    def _load_contents(self, blocks: List[Dict[str, Any]]) -> None:
+        """Fill in block content from the message log where it isn't loaded yet."""
+        missing = {b["id"] for b in blocks if b["content"] is None}
+        if not missing or not self._log_path.exists():
+            return
+
+        contents = {}
+        with open(self._log_path, encoding="utf-8") as f:
+            for line in f:
+                entry = loads(line)
+                if entry["id"] in missing:
+                    contents[entry["id"]] = entry["content"]
+
+        for block in blocks:
+            if block["content"] is None:
+                block["content"] = contents.get(block["id"], "")
+
+    def _count_log_lines(self) -> int:
+        if not self._log_path.exists():
+            return 0
+        with open(self._log_path, "rb") as f:
+            return sum(1 for _ in f)
+
+    def _compact_log(self) -> None:
+        """
+        Rewrite the message log with only the messages still in the window.
+
+        Summarized and evicted messages are never read again, so without
+        this the log grows forever and every content reload scans it. The
+        checkpoint is written first, so whichever log survives a crash has
+        the content of every block it lists.
+        """
+        self._write_checkpoint()
+        blocks = list(self._window)
+        self._load_contents(blocks)
+        tmp_path = self._log_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as log:
+            for block in blocks:
+                log.write(dumps({"id": block["id"], "content": block["content"]}))
+                log.write("\n")
+            log.flush()
+            os.fsync(log.fileno())
+        os.replace(tmp_path, self._log_path)
+        self._log_lines = len(blocks)
+
+    def _recent_blocks(self, limit: int) -> List[Dict[str, Any]]:
+        """Return the newest `limit` exchanges (user + assistant messages)."""
+        if limit <= 0:
+            return []
+        start = max(0, len(self._window) - limit * 2)
+        recent = list(islice(self._window, start, None))
+        self._load_contents(recent)
+        return recent
+
+    async def _summarize(self) -> None:
+        """
+        Fold older messages into the running conversation summary.
+
+        Keeps the latest exchange verbatim and drains the summarized
+        messages from the left of the window. Summaries are looked up in the
+        summary store first, so an already-summarized prefix skips the LLM.
+        """
+        count = len(self._window) - 2
+        if count <= 0:
+            return
+        pending = list(islice(self._window, count))
+
+        key = summary_key(
+            [self._summary_key, *(b["hash"] for b in pending)],
+            self.llm_model or "",
+            PROMPT_VERSION,
+        )
+        summary = await self.summary_store.get(key)
+
+        if summary is None:
+            self._load_contents(pending)
+            new_lines = "\n".join(f"{b['role']}: {b['content']}" for b in pending)
+            prompt = SUMMARY_PROMPT.format(summary=self._summary, new_lines=new_lines)
+            summary = (await self.llm.apredict(prompt)).strip()
+            await self.summary_store.set(key, summary)
+
+        # Only the decision part is paraphrased; quoted phrases and handles
+        # are carried over verbatim
+        for block in pending:
+            if block["summary"]:
+                self._exchange_core.update(
+                    dict.fromkeys(block["summary"]["exchange_core"])
+                )
+                self._handles.update(dict.fromkeys(block["summary"]["handles"]))
+
+        for _ in range(count):
+            self._window_tokens -= self._window.popleft()["tokens"]
+
+        self._summary = summary
+        self._summary_key = key
+        self._summarized_upto += count
+        self._write_checkpoint()
+
+    async def _make_room_with_summary(self) -> None:
+        """Summarize before storing if over the token budget or about to evict."""
+        if (
+            len(self._window) + 2 > self.max_window_messages
+            or self._window_tokens > self.max_tokens
+        ):
+            await self._summarize()
+
+    async def _make_room_by_eviction(self) -> None:
+        """Buffer memory lets the window drop the oldest messages."""
+
+    def _summary_entries(self, now_iso: str) -> List[Dict[str, Any]]:
+        """The running summary as a context entry, or nothing before the first one."""
+        if not self._summary:
+            return []
+        summary = f"Conversation summary: {self._summary}"
+        if self._exchange_core:
+            summary += "\nQuoted: " + " | ".join(self._exchange_core)
+        if self._handles:
+            summary += "\nReferences: " + " ".join(self._handles)
+        return [
+            {
+                "role": "system",
+                "content": summary,
+                "timestamp": now_iso,
+            }
+        ]
+
+    def _message_entries(self, limit: int, now_iso: str) -> List[Dict[str, Any]]:
+        return [
+            {
+                "role": block["role"],
+                "content": block["content"],
+                "timestamp": block.get("timestamp") or now_iso,
+            }
+            for block in self._recent_blocks(limit)
+        ]
+
+    def _format_buffer(
+        self, limit: int, context_id: Optional[str], now_iso: str
+    ) -> List[Dict[str, Any]]:
+        """Recent messages only."""
+        return self._message_entries(limit, now_iso)
+
+    def _format_summary(
+        self, limit: int, context_id: Optional[str], now_iso: str
+    ) -> List[Dict[str, Any]]:
+        """Running summary only, or recent messages until there is one."""
+        return self._summary_entries(now_iso) or self._message_entries(limit, now_iso)
+
+    def _format_buffer_summary(
+        self, limit: int, context_id: Optional[str], now_iso: str
+    ) -> List[Dict[str, Any]]:
+        """Running summary followed by recent unsummarized messages."""
+        return [
+            *self._summary_entries(now_iso),
+            *self._message_entries(limit, now_iso),
+        ]
+
     async def initialize(self) -> None:
         """
         Initialize LangChain memory components.
@@ -69,9 +367,48 @@ class LangChainMemoryProvider:
         Creates the appropriate memory type based on configuration.
         If persist_directory exists, loads previous memory state.
         """
+        # Resolve per-type behaviour once so the hot paths are direct calls
+        formatters = {
+            "buffer": self._format_buffer,
+            "summary": self._format_summary,
+            "buffer_summary": self._format_buffer_summary,
+        }
+        if self.memory_type not in formatters:
+            raise ValueError(f"Unknown memory type: {self.memory_type}")
+        self._format_context = formatters[self.memory_type]
+        summarize = self.memory_type != "buffer" and self.summarize_old
+        if summarize and self.llm is None:
+            logger.warning(
+                "No LLM set for %s memory; old messages will be dropped "
+                "instead of summarized",
+                self.memory_type,
+            )
+            summarize = False
+        if summarize:
+            self._make_room = self._make_room_with_summary
+            # Only summarizing may remove messages, so turns are never
+            # dropped without having been summarized
+            window_maxlen = None
+        else:
+            self._make_room = self._make_room_by_eviction
+            window_maxlen = self.max_window_messages
+        self._window = deque(self._window, maxlen=window_maxlen)
+
         # Create directory if it doesn't exist
         Path(self.persist_directory).mkdir(parents=True, exist_ok=True)
 
+        # Restore block metadata; content is loaded lazily from the message log
+        self._load_checkpoint()
+
+        self._log_lines = self._count_log_lines()
+
+        # Only the summary types ever look up or store summaries
+        if self.summary_store is None and window_maxlen is None:
+            self.summary_store = SQLiteSummaryStore(
+                str(Path(self.persist_directory) / SUMMARY_DB_FILE)
+            )
+            await self.summary_store.initialize()
+
         # Here we would initialize the LangChain memory
         # For now, this is just a placeholder
         """
@@ -114,8 +451,10 @@ class LangChainMemoryProvider:
         """
 
         self.is_initialized = True
-        print(f"LangChain Memory Provider initialized with type: {self.memory_type}")
-        print(f"Memory path: {self.persist_directory}")
+        logger.info(
+            "LangChain Memory Provider initialized with type: %s", self.memory_type
+        )
+        logger.info("Memory path: %s", self.persist_directory)
 
     async def store_interaction(
         self,
@@ -155,8 +494,41 @@ class LangChainMemoryProvider:
         # ...
         """
 
-        print(
-            f"Stored interaction in LangChain memory: {intent.get('action', 'unknown')}"
+        # Fold old messages into the summary before the window evicts them
+        await self._make_room()
+
+        timestamp = datetime.now().isoformat()
+        with open(self._log_path, "a", encoding="utf-8") as log:
+            for role, content in (
+                ("user", intent.get("text", "No text")),
+                ("assistant", response),
+            ):
+                block = {
+                    "id": self._next_block_id,
+                    "role": role,
+                    "hash": _content_hash(content),
+                    "tokens": _estimate_tokens(content),
+                    "timestamp": timestamp,
+                    "summary": _distill_block(content),
+                    "content": content,
+                }
+                self._next_block_id += 1
+                if len(self._window) == self._window.maxlen:
+                    # Appending evicts the oldest block
+                    self._window_tokens -= self._window[0]["tokens"]
+                self._window.append(block)
+                self._window_tokens += block["tokens"]
+                log.write(dumps({"id": block["id"], "content": content}) + "\n")
+        self._log_lines += 2
+
+        if self._log_lines > LOG_COMPACT_FACTOR * max(
+            len(self._window), self.max_window_messages
+        ):
+            self._compact_log()
+
+        logger.debug(
+            "Stored interaction in LangChain memory: %s",
+            intent.get("action", "unknown"),
         )
 
     async def get_recent_context(
@@ -177,49 +549,8 @@ class LangChainMemoryProvider:
                 "Memory provider not initialized. Call initialize() first."
             )
 
-        # Here we would query LangChain memory
-        # For now, we just return an empty list
-        """
-        # Uncomment for actual implementation:
-
-        # Get memory variables
-        memory_vars = self.memory.load_memory_variables({})
-
-        # Format depends on memory type
-        if self.memory_type == "buffer":
-            # Return recent messages
-            messages = memory_vars.get("history", [])
-
-            # Format for return
-            formatted_context = []
-            for i, message in enumerate(messages[-limit*2:]):
-                if i % 2 == 0:  # User message
-                    formatted_context.append({
-                        "role": "user",
-                        "content": message.content,
-                        "timestamp": datetime.now().isoformat()  # We don't have actual timestamp
-                    })
-                else:  # AI message
-                    formatted_context.append({
-                        "role": "assistant",
-                        "content": message.content,
-                        "timestamp": datetime.now().isoformat()
-                    })
-
-            return formatted_context
-
-        elif self.memory_type in ["summary", "buffer_summary"]:
-            # Return summary + recent messages for buffer_summary
-            summary = memory_vars.get("history_summary", "")
-
-            return [{
-                "role": "system",
-                "content": f"Conversation summary: {summary}",
-                "timestamp": datetime.now().isoformat()
-            }]
-        """
-
-        return []
+        # One clock read per call, shared by every entry that needs a timestamp
+        return self._format_context(limit, context_id, datetime.now().isoformat())
 
     async def search_similar(
         self, query_embedding: List[float], k: int = 5
@@ -240,8 +571,8 @@ class LangChainMemoryProvider:
         """
         # LangChain memory doesn't support vector search
         # This method exists for protocol compatibility
-        print(
-            "Warning: LangChain memory doesn't support semantic search. Use RAG provider instead."
+        logger.warning(
+            "LangChain memory doesn't support semantic search. Use RAG provider instead."
         )
         return []
 
@@ -267,7 +598,19 @@ class LangChainMemoryProvider:
         self.memory.clear()
         """
 
-        print(f"Cleared session {session_id} from LangChain memory")
+        # Sessions aren't tracked separately, so this clears all memory
+        self._window.clear()
+        self._window_tokens = 0
+        self._summary = ""
+        self._summary_key = ""
+        self._summarized_upto = 0
+        self._exchange_core.clear()
+        self._handles.clear()
+        self._log_path.unlink(missing_ok=True)
+        self._log_lines = 0
+        self._write_checkpoint()
+
+        logger.debug("Cleared session %s from LangChain memory", session_id)
 
     async def close(self) -> None:
         """Close connections and clean up resources."""
@@ -281,8 +624,15 @@ class LangChainMemoryProvider:
             # ...
             """
 
+            # Checkpoint metadata only; content is already in the message log
+            self._write_checkpoint()
+
+            if self._owns_summary_store and self.summary_store is not None:
+                await self.summary_store.close()
+                self.summary_store = None
+
             self.is_initialized = False
-            print("LangChain Memory Provider closed")
+            logger.info("LangChain Memory Provider closed")
 
 
 # Example usage:
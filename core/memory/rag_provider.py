@@ -10,17 +10,40 @@ the simpler memory stores while providing semantic search capabilities.
 Status: BASE IMPLEMENTATION - Ready for future expansion
 """
 
+import atexit
+import hashlib
+import logging
 import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol, Union
 
+import numpy as np
+
+from core.memory._sim import INT8_SCALE, normalize, topk_cosine
+from core.memory.distillation import distill_interaction
+
 # These imports would be uncommented when implementing the full functionality
-# import numpy as np
 # from langchain.embeddings import HuggingFaceEmbeddings
 # from langchain.vectorstores import Chroma
 
+logger = logging.getLogger(__name__)
+
+# Columnar interaction store
+_INITIAL_CAPACITY = 64
+
+# Storage dtypes for normalized embeddings and the factor components are
+# scaled by before storing (int8 keeps round(x * 127))
+_EMBEDDING_SCALES = {"int8": INT8_SCALE, "float16": 1.0, "float32": 1.0}
+
+# Number of un-persisted writes before the vector DB is flushed to disk
+PERSIST_BATCH_SIZE = 32
+
+# Content hashes of added documents, stored as raw 16-byte digests
+DOC_HASH_FILE = "doc_hashes"
+
 
 class ContextProvider(Protocol):
     """Protocol defining the interface for any context/memory provider."""
@@ -74,6 +97,7 @@ class RAGProvider(ABC):
         embedding_model: Name of embedding model to use
         chunk_size: Size of text chunks for embedding
         search_k: Number of results to return in similarity search
+        embedding_dtype: Storage type of embeddings ("int8", "float16", "float32")
     """
 
     def __init__(
@@ -82,6 +106,7 @@ class RAGProvider(ABC):
         embedding_model: str = "all-MiniLM-L6-v2",
         chunk_size: int = 512,
         search_k: int = 5,
+        embedding_dtype: str = "int8",
     ):
         """
         Initialize RAG provider.
@@ -93,17 +118,118 @@ class RAGProvider(ABC):
                 Options: all-mpnet-base-v2 (better but slower)
             chunk_size: Size of text chunks for embedding
             search_k: Default number of results to return in searches
+            embedding_dtype: How normalized embeddings are stored
+                Default: int8 (quarter of float32 size, small precision loss)
+                Options: float16 (half size), float32 (exact)
         """
+        if embedding_dtype not in _EMBEDDING_SCALES:
+            raise ValueError(f"Unknown embedding dtype: {embedding_dtype}")
+
         self.persist_directory = persist_directory
         self.embedding_model = embedding_model
         self.chunk_size = chunk_size
         self.search_k = search_k
+        self.embedding_dtype = embedding_dtype
+        self._emb_scale = _EMBEDDING_SCALES[embedding_dtype]
 
         # Will be initialized during initialize()
         self.embeddings = None
         self.vectordb = None
         self.is_initialized = False
 
+        # Columnar (struct-of-arrays) copy of stored interactions, used for
+        # recency queries and session filtering without walking per-row dicts
+        self._size = 0
+        self._ts = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._session = np.empty(_INITIAL_CAPACITY, dtype=np.uint32)
+        self._emb: Optional[np.ndarray] = None  # (capacity, dim), allocated lazily
+        self._has_emb = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self._texts: List[str] = []
+        self._stamps: List[str] = []  # ISO timestamps, formatted once on append
+        self._session_ids: Dict[str, int] = {}
+        self._session_names: Dict[int, str] = {}  # Reverse of _session_ids
+        self._next_session_id = 0
+
+        # Vector DB row IDs per session, so clearing a session deletes
+        # exactly its rows instead of scanning by metadata filter
+        self._session_index: Dict[str, List[int]] = defaultdict(list)
+        self._next_row_id = 0
+
+        # Writes since the last vector DB persist (see flush)
+        self._dirty_count = 0
+        self._atexit_registered = False
+
+    def _grow(self, capacity: int) -> None:
+        """Resize the column arrays to hold at least `capacity` rows."""
+        self._ts = np.resize(self._ts, capacity)
+        self._session = np.resize(self._session, capacity)
+        self._has_emb = np.resize(self._has_emb, capacity)
+        if self._emb is not None:
+            emb = np.zeros((capacity, self._emb.shape[1]), dtype=self._emb.dtype)
+            emb[: self._size] = self._emb[: self._size]
+            self._emb = emb
+
+    def _append_row(
+        self,
+        text: str,
+        timestamp: datetime,
+        session_id: str,
+        embedding: Optional[List[float]] = None,
+    ) -> int:
+        """
+        Append one interaction to the columnar store.
+
+        Args:
+            text: Interaction text
+            timestamp: Time of the interaction
+            session_id: Session the interaction belongs to
+            embedding: Optional embedding vector
+
+        Returns:
+            Row index of the new interaction
+        """
+        row = self._size
+        if row == len(self._ts):
+            self._grow(2 * len(self._ts))  # Amortized doubling
+
+        sid = self._session_ids.get(session_id)
+        if sid is None:
+            sid = self._session_ids[session_id] = self._next_session_id
+            self._session_names[sid] = session_id
+            self._next_session_id += 1
+        self._ts[row] = timestamp.timestamp()
+        self._session[row] = sid
+        self._texts.append(text)
+        self._stamps.append(timestamp.isoformat())
+
+        if embedding is not None:
+            vec = np.asarray(embedding, dtype=np.float32)
+            if self._emb is None:
+                # Zeroed, since earlier rows had no embedding
+                self._emb = np.zeros(
+                    (len(self._ts), vec.shape[0]), dtype=self.embedding_dtype
+                )
+            vec = normalize(vec)
+            if self.embedding_dtype == "int8":
+                vec = np.round(vec * self._emb_scale)
+            self._emb[row] = vec
+        elif self._emb is not None:
+            self._emb[row] = 0
+        self._has_emb[row] = embedding is not None
+
+        self._size = row + 1
+        return row
+
+    def _flush_sync(self) -> None:
+        """Persist pending vector DB writes, if any."""
+        if self._dirty_count and self.vectordb is not None:
+            self.vectordb.persist()
+        self._dirty_count = 0
+
+    async def flush(self) -> None:
+        """Persist pending writes to disk without waiting for a full batch."""
+        self._flush_sync()
+
     async def initialize(self) -> None:
         """
         Initialize RAG provider with vector database.
@@ -136,11 +262,23 @@ class RAGProvider(ABC):
                 persist_directory=self.persist_directory,
                 embedding_function=self.embeddings
             )
+
+        # Rebuild the session index from the rows already on disk
+        existing = self.vectordb.get(include=["metadatas"])
+        for row_id, metadata in zip(existing["ids"], existing["metadatas"]):
+            self._session_index[metadata["session_id"]].append(int(row_id))
+            self._next_row_id = max(self._next_row_id, int(row_id) + 1)
         """
 
+        # Make sure a partial batch still reaches disk on interpreter exit.
+        # Registered once, however often initialize() is called
+        if not self._atexit_registered:
+            atexit.register(self._flush_sync)
+            self._atexit_registered = True
+
         self.is_initialized = True
-        print(f"RAG Provider initialized with model {self.embedding_model}")
-        print(f"Vector DB path: {self.persist_directory}")
+        logger.info("RAG Provider initialized with model %s", self.embedding_model)
+        logger.info("Vector DB path: %s", self.persist_directory)
 
     async def store_interaction(
         self,
@@ -159,15 +297,24 @@ class RAGProvider(ABC):
         if not self.is_initialized:
             raise RuntimeError("RAG provider not initialized. Call initialize() first.")
 
-        # Construct interaction text
-        interaction_text = (
-            f"User: {intent.get('text', 'No text')}\n"
-            f"Intent: {intent.get('action', 'unknown')}\n"
-            f"Response: {response}"
+        session_id = intent.get("session_id", "default")
+
+        # Structured record (decision, quoted phrases, handles) for metadata
+        user_text = str(intent.get("text", "No text"))
+        record = distill_interaction(
+            user_text, str(intent.get("action", "unknown")), response
         )
 
-        timestamp = datetime.now().isoformat()
-        session_id = intent.get("session_id", "default")
+        # Embedded text keeps the user's words verbatim, so recency and
+        # similarity queries can still match on what was asked
+        interaction_text = f"User: {user_text}\n{record['decision']}"
+
+        now = datetime.now()
+        self._append_row(interaction_text, now, session_id, embedding)
+
+        row_id = self._next_row_id
+        self._next_row_id += 1
+        self._session_index[session_id].append(row_id)
 
         # Here we would store in the vector database
         # For now, this is just a placeholder
@@ -184,17 +331,23 @@ class RAGProvider(ABC):
         self.vectordb.add_texts(
             texts=[interaction_text],
             metadatas=[{
-                "timestamp": timestamp,
+                "timestamp": now.isoformat(),
                 "session_id": session_id,
-                "type": "interaction"
-            }]
+                "type": "interaction",
+                **record,
+            }],
+            ids=[str(row_id)]
         )
-
-        # Persist to disk
-        self.vectordb.persist()
         """
 
-        print(f"Stored interaction in RAG DB: {intent.get('action', 'unknown')}")
+        # Persist in batches rather than on every interaction
+        self._dirty_count += 1
+        if self._dirty_count >= PERSIST_BATCH_SIZE:
+            self._flush_sync()
+
+        logger.debug(
+            "Stored interaction in RAG DB: %s", intent.get("action", "unknown")
+        )
 
     async def get_recent_context(
         self, limit: int = 10, context_id: Optional[str] = None
@@ -212,9 +365,35 @@ class RAGProvider(ABC):
         if not self.is_initialized:
             raise RuntimeError("RAG provider not initialized. Call initialize() first.")
 
-        # Here we would query the vector database by recency
-        # For now, we just return an empty list
-        return []
+        if context_id is not None:
+            sid = self._session_ids.get(context_id)
+            if sid is None:
+                return []
+            rows = np.flatnonzero(self._session[: self._size] == sid)
+        else:
+            rows = np.arange(self._size)
+
+        if limit <= 0 or len(rows) == 0:
+            return []
+
+        # Partial selection of the newest `limit` rows, then order just those
+        ts = self._ts[rows]
+        if limit < len(rows):
+            top = np.argpartition(-ts, limit - 1)[:limit]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(-ts[top], kind="stable")]
+
+        session_names = self._session_names
+        return [
+            {
+                "role": "interaction",
+                "content": self._texts[row],
+                "timestamp": self._stamps[row],
+                "session_id": session_names[int(self._session[row])],
+            }
+            for row in rows[top]
+        ]
 
     async def search_similar(
         self, query_embedding: Union[List[float], str], k: int = None
@@ -234,8 +413,8 @@ class RAGProvider(ABC):
 
         k = k or self.search_k
 
-        # Here we would perform similarity search
-        # For now, we just return an empty list
+        # Here we would perform similarity search for text queries
+        # For now, only pre-computed embeddings are searched (see below)
         """
         # Uncomment for actual implementation:
 
@@ -263,7 +442,30 @@ class RAGProvider(ABC):
         return formatted_results
         """
 
-        return []
+        if isinstance(query_embedding, str) or self._emb is None or not self._size:
+            return []
+
+        query = normalize(np.asarray(query_embedding, dtype=np.float32))
+
+        # Stored rows are normalized at insert time, so cosine is a dot product.
+        # Rows stored without an embedding are zero vectors and never match
+        rows, scores = topk_cosine(
+            self._emb[: self._size], query, k, mask=self._has_emb[: self._size]
+        )
+
+        session_names = self._session_names
+        return [
+            {
+                "content": self._texts[row],
+                "metadata": {
+                    "timestamp": self._stamps[row],
+                    "session_id": session_names[int(self._session[row])],
+                    "type": "interaction",
+                },
+                "similarity": float(score) / self._emb_scale,
+            }
+            for row, score in zip(rows, scores)
+        ]
 
     async def clear_session(self, session_id: str) -> None:
         """
@@ -275,34 +477,44 @@ class RAGProvider(ABC):
         if not self.is_initialized:
             raise RuntimeError("RAG provider not initialized. Call initialize() first.")
 
+        sid = self._session_ids.pop(session_id, None)
+        if sid is not None:
+            del self._session_names[sid]
+            keep = self._session[: self._size] != sid
+            n = int(keep.sum())
+            self._ts[:n] = self._ts[: self._size][keep]
+            self._session[:n] = self._session[: self._size][keep]
+            self._has_emb[:n] = self._has_emb[: self._size][keep]
+            if self._emb is not None:
+                self._emb[:n] = self._emb[: self._size][keep]
+            self._texts = [text for text, k in zip(self._texts, keep) if k]
+            self._stamps = [stamp for stamp, k in zip(self._stamps, keep) if k]
+            self._size = n
+
+        row_ids = self._session_index.pop(session_id, [])
+
         # Here we would delete entries from the vector database
         # For now, this is just a placeholder
         """
         # Uncomment for actual implementation:
 
-        # Delete by metadata filter
-        self.vectordb.delete(
-            where={"session_id": session_id}
-        )
+        # Delete exactly the session's rows by ID (no metadata-filter scan)
+        if row_ids:
+            self.vectordb.delete(ids=[str(row_id) for row_id in row_ids])
         """
 
-        print(f"Cleared session {session_id} from RAG DB")
+        logger.debug("Cleared session %s from RAG DB", session_id)
 
     async def close(self) -> None:
         """Close connections and clean up resources."""
         if self.is_initialized:
-            # Here we would close the vector database
-            # For now, this is just a placeholder
-            """
-            # Uncomment for actual implementation:
-
             # Ensure all data is persisted
-            if self.vectordb:
-                self.vectordb.persist()
-            """
+            self._flush_sync()
+            atexit.unregister(self._flush_sync)
+            self._atexit_registered = False
 
             self.is_initialized = False
-            print("RAG Provider closed")
+            logger.info("RAG Provider closed")
 
 
 class ChromaRAGProvider(RAGProvider):
@@ -320,6 +532,11 @@ class ChromaRAGProvider(RAGProvider):
         # Chroma-specific initialization would go here
         # For now, this is just a placeholder
 
+        # Hashes of documents added in earlier runs, so they aren't re-embedded
+        hash_path = Path(self.persist_directory) / DOC_HASH_FILE
+        data = hash_path.read_bytes() if hash_path.exists() else b""
+        self._doc_hashes = {data[i : i + 16] for i in range(0, len(data), 16)}
+
     async def add_documents(
         self, documents: List[str], metadatas: List[Dict[str, Any]] = None
     ) -> None:
@@ -333,9 +550,38 @@ class ChromaRAGProvider(RAGProvider):
         if not self.is_initialized:
             raise RuntimeError("RAG provider not initialized. Call initialize() first.")
 
-        # This would add multiple documents at once
-        # For now, this is just a placeholder
-        print(f"Added {len(documents)} documents to RAG DB")
+        if metadatas is None:
+            metadatas = [{} for _ in documents]
+
+        # Skip documents whose exact text is already stored (or repeats
+        # earlier in this batch); each one saves an embedding pass
+        new_documents, new_metadatas, new_hashes = [], [], []
+        for document, metadata in zip(documents, metadatas):
+            digest = hashlib.blake2b(document.encode(), digest_size=16).digest()
+            if digest in self._doc_hashes:
+                continue
+            self._doc_hashes.add(digest)
+            new_documents.append(document)
+            new_metadatas.append(metadata)
+            new_hashes.append(digest)
+
+        if new_documents:
+            # This would add multiple documents at once
+            # For now, this is just a placeholder
+            """
+            # Uncomment for actual implementation:
+
+            self.vectordb.add_texts(texts=new_documents, metadatas=new_metadatas)
+            """
+
+            with open(Path(self.persist_directory) / DOC_HASH_FILE, "ab") as f:
+                f.write(b"".join(new_hashes))
+
+        logger.debug(
+            "Added %d documents to RAG DB (%d duplicates skipped)",
+            len(new_documents),
+            len(documents) - len(new_documents),
+        )
 
 
 # Example usage:
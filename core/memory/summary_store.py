@@ -0,0 +1,109 @@
+"""
+Summary Stores for AutoReturn
+
+Caches conversation summaries keyed by a hash of the summarized messages,
+the summarizer model and the prompt version. The LangChain memory provider
+consults the store before calling the LLM, so replaying or branching a
+conversation over an already-summarized prefix costs no summarizer call.
+
+Stores follow the SummaryStore protocol, so a different backend can be
+plugged in without changing the memory provider.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Protocol
+
+import aiosqlite
+
+
+def summary_key(
+    message_hashes: Iterable[str], model_name: str, prompt_version: str
+) -> str:
+    """
+    Build the cache key for a summary.
+
+    Args:
+        message_hashes: Content hashes of the summarized messages, in order
+        model_name: Name of the summarizer model
+        prompt_version: Version of the summarization prompt
+
+    Returns:
+        Hex digest identifying the summary
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("|".join(message_hashes).encode())
+    digest.update(model_name.encode())
+    digest.update(prompt_version.encode())
+    return digest.hexdigest()
+
+
+class SummaryStore(Protocol):
+    """Protocol for summary caches used by the memory providers."""
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached summary for key, or None on a miss."""
+        ...
+
+    async def set(self, key: str, value: str) -> None:
+        """Cache a summary under key."""
+        ...
+
+
+class InMemorySummaryStore:
+    """Process-local summary cache backed by a dict."""
+
+    def __init__(self):
+        self._summaries: Dict[str, str] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._summaries.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self._summaries[key] = value
+
+
+class SQLiteSummaryStore:
+    """
+    Summary cache persisted in SQLite, so summaries survive restarts.
+
+    Attributes:
+        db_path: Path of the SQLite database file
+    """
+
+    def __init__(self, db_path: str = "memory/langchain/summaries.db"):
+        self.db_path = db_path
+        self.db: Optional[aiosqlite.Connection] = None
+
+    async def initialize(self) -> None:
+        """Open the database and create the summaries table."""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.db = await aiosqlite.connect(self.db_path)
+        await self.db.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                summary TEXT NOT NULL
+            )
+        """)
+        await self.db.commit()
+
+    async def get(self, key: str) -> Optional[str]:
+        cursor = await self.db.execute(
+            "SELECT summary FROM summaries WHERE key = ?", (key,)
+        )
+        row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def set(self, key: str, value: str) -> None:
+        await self.db.execute(
+            "INSERT OR REPLACE INTO summaries (key, summary) VALUES (?, ?)",
+            (key, value),
+        )
+        await self.db.commit()
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        if self.db:
+            await self.db.close()
+            self.db = None
@@ -43,7 +43,32 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string."""
+    return datetime.now().isoformat()
+
+
+def _lookup(enum_cls: type) -> Dict[str, Enum]:
+    """Build a lowercase value -> member table for an enum."""
+    return {member.value: member for member in enum_cls}
+
+
+_SOURCES = _lookup(MessageSource)
+_SENTIMENTS = _lookup(SentimentType)
+_TONES = _lookup(ToneType)
+_STATUSES = _lookup(TaskStatus)
+
+
+def _coerce(enum_cls: type, value: str, lookup: Dict[str, Enum]) -> Enum:
+    """Convert a case-insensitive string to an enum member."""
+    member = lookup.get(value)
+    if member is None:
+        # Only mixed-case or unknown values pay for lower(); unknown raises
+        member = lookup.get(value.lower()) or enum_cls(value.lower())
+    return member
+
+
+@dataclass(slots=True)
 class Message:
     """
     Represents an incoming message from Gmail or Slack.
@@ -62,19 +87,20 @@ class Message:
     def __post_init__(self):
         """Set default timestamp if not provided"""
         if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
+            self.timestamp = _now_iso()
 
         # Convert string source to enum if needed
         if isinstance(self.source, str):
-            self.source = MessageSource(self.source.lower())
+            self.source = _coerce(MessageSource, self.source, _SOURCES)
 
     def validate(self) -> bool:
         """Validate message data integrity"""
-        if not self.id or not self.content or not self.sender:
-            return False
-        if self.source not in MessageSource:
-            return False
-        return True
+        return bool(
+            self.id
+            and self.content
+            and self.sender
+            and isinstance(self.source, MessageSource)
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary"""
@@ -94,7 +120,7 @@ class Message:
         """Deserialize from dictionary"""
         return cls(
             id=data["id"],
-            source=MessageSource(data["source"]),
+            source=_coerce(MessageSource, data["source"], _SOURCES),
             content=data["content"],
             sender=data["sender"],
             subject=data.get("subject"),
@@ -104,7 +130,7 @@ class Message:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageAnalysis:
     """
     Result of LLM analysis on a message.
@@ -126,21 +152,19 @@ class MessageAnalysis:
     def __post_init__(self):
         """Convert string enums if needed"""
         if isinstance(self.sentiment, str):
-            self.sentiment = SentimentType(self.sentiment.lower())
+            self.sentiment = _coerce(SentimentType, self.sentiment, _SENTIMENTS)
         if isinstance(self.tone, str):
-            self.tone = ToneType(self.tone.lower())
+            self.tone = _coerce(ToneType, self.tone, _TONES)
 
     def validate(self) -> bool:
         """Validate analysis data"""
-        if not self.message_id or not self.summary:
-            return False
-        if not (-1.0 <= self.sentiment_score <= 1.0):
-            return False
-        if not (0 <= self.urgency_level <= 10):
-            return False
-        if not (0 <= self.priority_score <= 100):
-            return False
-        return True
+        return bool(
+            self.message_id
+            and self.summary
+            and -1.0 <= self.sentiment_score <= 1.0
+            and 0 <= self.urgency_level <= 10
+            and 0 <= self.priority_score <= 100
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary"""
@@ -159,7 +183,7 @@ class MessageAnalysis:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Represents an actionable task extracted from a message.
@@ -180,23 +204,24 @@ class Task:
     def __post_init__(self):
         """Set defaults and convert enums"""
         if self.created_at is None:
-            self.created_at = datetime.now().isoformat()
+            self.created_at = _now_iso()
 
         if isinstance(self.status, str):
-            self.status = TaskStatus(self.status.lower())
+            self.status = _coerce(TaskStatus, self.status, _STATUSES)
 
     def validate(self) -> bool:
         """Validate task data"""
-        if not self.id or not self.title or not self.source_message_id:
-            return False
-        if not (0 <= self.priority <= 100):
-            return False
-        return True
+        return bool(
+            self.id
+            and self.title
+            and self.source_message_id
+            and 0 <= self.priority <= 100
+        )
 
     def mark_completed(self) -> None:
         """Mark task as completed"""
         self.status = TaskStatus.COMPLETED
-        self.completed_at = datetime.now().isoformat()
+        self.completed_at = _now_iso()
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary"""
@@ -224,7 +249,7 @@ class Task:
             source_message_id=data["source_message_id"],
             priority=data["priority"],
             deadline=data.get("deadline"),
-            status=TaskStatus(data.get("status", "pending")),
+            status=_coerce(TaskStatus, data.get("status", "pending"), _STATUSES),
             assigned_to=data.get("assigned_to"),
             created_at=data.get("created_at"),
             completed_at=data.get("completed_at"),
@@ -232,7 +257,7 @@ class Task:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Intent:
     """
     Represents user intent classification result.
@@ -248,11 +273,7 @@ class Intent:
 
     def validate(self) -> bool:
         """Validate intent data"""
-        if not self.action or not self.target:
-            return False
-        if not (0.0 <= self.confidence <= 1.0):
-            return False
-        return True
+        return bool(self.action and self.target and 0.0 <= self.confidence <= 1.0)
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary"""
@@ -266,7 +287,7 @@ class Intent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
     """
     Represents conversation context for LLM memory.
@@ -282,7 +303,7 @@ class Context:
 
     def __post_init__(self):
         if not self.timestamp:
-            self.timestamp = datetime.now().isoformat()
+            self.timestamp = _now_iso()
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary"""
@@ -296,7 +317,7 @@ class Context:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Notification:
     """
     Represents a notification to be shown to the user.
@@ -314,10 +335,10 @@ class Notification:
 
     def __post_init__(self):
         if not self.timestamp:
-            self.timestamp = datetime.now().isoformat()
+            self.timestamp = _now_iso()
 
         if isinstance(self.source, str):
-            self.source = MessageSource(self.source.lower())
+            self.source = _coerce(MessageSource, self.source, _SOURCES)
 
     def mark_read(self) -> None:
         """Mark notification as read"""
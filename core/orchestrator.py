@@ -4,10 +4,135 @@ Executes LLM decisions and coordinates component actions.
 """
 
 import asyncio
+import hashlib
+import logging
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.serialization import loads
+
+logger = logging.getLogger(__name__)
+
+# LLM responses kept per rendered prompt (see Orchestrator._generate)
+COMPLETION_CACHE_SIZE = 1024
+
+# Messages analyzed per LLM call in batch_process_messages
+BATCH_SIZE = 5
+
+# Message content sent to the LLM is cut to this many characters
+MAX_CONTENT_CHARS = 4000
+
+# JSON fields requested from the LLM by the analysis prompts
+_SUMMARY_FIELDS = """  "summary": "One concise paragraph summarizing the main message",
+  "key_points": ["Key point 1", "Key point 2", "Key point 3"],
+  "sentiment": "positive" | "negative" | "neutral",
+  "urgency": 1-10 (10 is most urgent)"""
+
+_TASKS_FIELD = """  "tasks": [
+    {"description": "What needs to be done", "priority": 1-10 (10 is highest), "deadline": "YYYY-MM-DD" or null}
+  ]"""
+
+_TASK_RULES = (
+    "Only include clear, actionable items as tasks, not vague or informational "
+    "content. Use an empty list if there are no actionable tasks."
+)
+
+SUMMARY_FORMAT = f"""Write ONLY a JSON object matching this schema, no prose:
+{{
+{_SUMMARY_FIELDS}
+}}
+
+Be concise but capture all important information."""
+
+TASKS_FORMAT = f"""Write ONLY a JSON object matching this schema, no prose:
+{{
+{_TASKS_FIELD}
+}}
+
+{_TASK_RULES}"""
+
+# Output format shared by the single-message and batched analysis prompts
+ANALYSIS_FORMAT = f"""Write ONLY a JSON object matching this schema, no prose:
+{{
+{_SUMMARY_FIELDS},
+{_TASKS_FIELD}
+}}
+
+Be concise but capture all important information. {_TASK_RULES}"""
+
+# Static instruction blocks of the analysis prompts. Message content always
+# follows them, so every prompt of a kind shares a byte-identical prefix the
+# LLM server can serve from its prompt (KV) cache
+SUMMARY_INSTRUCTIONS = f"""You are the intelligent orchestrator for WorkEase, an AI communication assistant.
+
+Your task is to analyze the message below and provide a comprehensive summary.
+
+Provide your analysis in the following format:
+
+{SUMMARY_FORMAT}"""
+
+TASKS_INSTRUCTIONS = f"""You are the WorkEase orchestrator. Your task is to extract actionable tasks from the message below.
+
+Extract all actionable tasks. For each task, provide:
+1. Clear description of what needs to be done
+2. Priority (1-10, where 10 is highest)
+3. Deadline (if mentioned, in ISO format YYYY-MM-DD)
+
+{TASKS_FORMAT}"""
+
+ANALYSIS_INSTRUCTIONS = f"""You are the intelligent orchestrator for WorkEase, an AI communication assistant.
+
+Your task is to analyze the message below, summarize it and extract its actionable tasks.
+
+Provide your analysis in the following format:
+
+{ANALYSIS_FORMAT}"""
+
+BATCH_INSTRUCTIONS = f"""You are the intelligent orchestrator for WorkEase, an AI communication assistant.
+
+Your task is to analyze each of the messages below separately, summarize it and extract its actionable tasks.
+
+For message N, write a line "--- RESULT N ---" followed by its analysis. Each analysis uses the following format:
+
+{ANALYSIS_FORMAT}"""
+
+# "--- RESULT 3 ---" separators in batched responses
+_RESULT_DELIMITER_RE = re.compile(r"^\s*-{3}\s*RESULT\s+(\d+)\s*-{3}\s*$", re.MULTILINE)
+
+# Where the new part of an email ends: a quoted-reply header
+# ("On Mon, Bob <bob@x.com> wrote:", "-----Original Message-----") or the
+# "-- " signature separator
+_TRAILER_RE = re.compile(
+    r"^(?:On\s.+\swrote:|-{2,}\s*Original Message\s*-{2,}|--)[ \t]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def _compress_content(content: str, max_chars: int = MAX_CONTENT_CHARS) -> str:
+    """
+    Strip quoted replies and signatures from message content and cap its length.
+
+    Everything from the first reply header or signature separator on is
+    dropped, as are ">"-quoted lines. Content that is nothing but quotes
+    is kept as-is, so forwarded text is never reduced to nothing.
+    """
+    trimmed = content
+    trailer = _TRAILER_RE.search(trimmed)
+    if trailer:
+        trimmed = trimmed[: trailer.start()]
+    if ">" in trimmed:
+        trimmed = "\n".join(
+            line for line in trimmed.split("\n") if not line.lstrip().startswith(">")
+        )
+    trimmed = trimmed.strip() or content
+
+    if len(trimmed) > max_chars:
+        trimmed = trimmed[:max_chars] + "..."
+    return trimmed
 
 
 class MessageSource(Enum):
@@ -18,7 +143,7 @@ class MessageSource(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents an incoming message from any source"""
 
@@ -37,7 +162,7 @@ class Message:
             self.metadata = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents an extracted task from a message"""
 
@@ -54,7 +179,7 @@ class Task:
             self.created_at = datetime.now().isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageSummary:
     """Represents AI-generated summary of a message"""
 
@@ -85,7 +210,13 @@ class Orchestrator:
     intelligence and reasoning to the LLM brain.
     """
 
-    def __init__(self, llm_client, event_bus=None, context_provider=None):
+    def __init__(
+        self,
+        llm_client,
+        event_bus=None,
+        context_provider=None,
+        max_concurrency: int = 4,
+    ):
         """
         Initialize orchestrator with dependencies.
 
@@ -93,22 +224,31 @@ class Orchestrator:
             llm_client: LLM client for AI reasoning (local Ollama or cloud API)
             event_bus: Event bus for pub/sub communication (optional, not implemented yet)
             context_provider: Context/memory provider (optional, not implemented yet)
+            max_concurrency: Maximum LLM calls in flight at once
         """
         self.llm = llm_client
         self.event_bus = event_bus
         self.context_provider = context_provider
         self._task_counter = 0
 
+        # Bursts queue here instead of oversubscribing the (usually local) LLM
+        self._llm_slots = asyncio.Semaphore(max_concurrency)
+
+        # LRU of prompt hash -> raw LLM response, for duplicate messages
+        self._completion_cache: OrderedDict = OrderedDict()
+
+        # Prompt hash -> task of a generation still in progress
+        self._inflight: Dict[bytes, asyncio.Task] = {}
+
     async def process_message(self, message: Message) -> Dict[str, Any]:
         """
         Main entry point for processing incoming messages.
 
         Pipeline:
         1. Validate message
-        2. Generate AI summary using LLM
-        3. Extract tasks from message using LLM
-        4. (Future) Publish events to event bus
-        5. (Future) Store in database
+        2. Generate AI summary and extract tasks in a single LLM call
+        3. (Future) Publish events to event bus
+        4. (Future) Store in database
 
         Args:
             message: Incoming message from Gmail/Slack agent
@@ -116,28 +256,83 @@ class Orchestrator:
         Returns:
             Dict containing summary and extracted tasks
         """
-        # Step 1: Generate summary
-        summary = await self.summarize_message(message)
+        # Step 1: Summarize and extract tasks in one round-trip
+        prompt = self._build_combined_prompt(message)
+        llm_response = await self._generate(prompt)
+
+        return await self._finish_message(message, llm_response)
+
+    async def _finish_message(
+        self, message: Message, llm_response: str
+    ) -> Dict[str, Any]:
+        """
+        Parse a message's analysis and publish the result.
+
+        Args:
+            message: The analyzed message
+            llm_response: LLM output in ANALYSIS_FORMAT
 
-        # Step 2: Extract tasks
-        tasks = await self.extract_tasks_from_message(message, summary)
+        Returns:
+            Dict containing summary and extracted tasks
+        """
+        # One timestamp for the summary, its tasks and the result
+        now_iso = datetime.now().isoformat()
+        summary, tasks = self._parse_json_response(llm_response, message.id, now_iso)
 
-        # Step 3: Build result
+        # Step 2: Build result
         result = {
             "message_id": message.id,
             "source": message.source.value,
             "sender": message.sender,
             "summary": summary,
             "tasks": tasks,
-            "processed_at": datetime.now().isoformat(),
+            "processed_at": now_iso,
         }
 
-        # Step 4: (Future) Emit events
+        # Step 3: (Future) Emit events
         if self.event_bus:
             await self._emit_message_processed_event(result)
 
         return result
 
+    async def _generate(self, prompt: str) -> str:
+        """
+        Call the LLM, reusing the response for a previously seen prompt.
+
+        Forwarded threads, auto-replies and repeated notifications render to
+        identical prompts. The raw response is cached rather than parsed
+        results, so each message still gets its own IDs when parsed. A prompt
+        that is already being generated is awaited rather than sent again,
+        and only actual LLM calls take one of the max_concurrency slots.
+        """
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        response = self._completion_cache.get(key)
+        if response is not None:
+            self._completion_cache.move_to_end(key)
+            return response
+
+        call = self._inflight.get(key)
+        if call is None:
+            call = asyncio.create_task(self._call_llm(key, prompt))
+            # Retrieve the outcome even if every caller was cancelled
+            call.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = call
+        # Shielded so a cancelled caller doesn't cancel the call others share
+        return await asyncio.shield(call)
+
+    async def _call_llm(self, key: bytes, prompt: str) -> str:
+        """Run one LLM call for _generate and cache its response."""
+        try:
+            async with self._llm_slots:
+                response = await self.llm.generate(prompt)
+        finally:
+            del self._inflight[key]
+
+        self._completion_cache[key] = response
+        if len(self._completion_cache) > COMPLETION_CACHE_SIZE:
+            self._completion_cache.popitem(last=False)
+        return response
+
     async def summarize_message(self, message: Message) -> MessageSummary:
         """
         Generate AI-powered summary of the message using LLM.
@@ -155,10 +350,10 @@ class Orchestrator:
         prompt = self._build_summarization_prompt(message)
 
         # Call LLM (this is where the AI reasoning happens)
-        llm_response = await self.llm.generate(prompt)
+        llm_response = await self._generate(prompt)
 
         # Parse LLM response into structured summary
-        summary = self._parse_summary_response(llm_response, message.id)
+        summary, _ = self._parse_json_response(llm_response, message.id)
 
         return summary
 
@@ -182,10 +377,10 @@ class Orchestrator:
         prompt = self._build_task_extraction_prompt(message, summary)
 
         # Call LLM for task extraction reasoning
-        llm_response = await self.llm.generate(prompt)
+        llm_response = await self._generate(prompt)
 
         # Parse LLM response into structured tasks
-        tasks = self._parse_tasks_response(llm_response, message.id)
+        _, tasks = self._parse_json_response(llm_response, message.id)
 
         return tasks
 
@@ -199,30 +394,10 @@ class Orchestrator:
         - Assess urgency
         - Be concise
         """
-        prompt = f"""You are the intelligent orchestrator for WorkEase, an AI communication assistant.
-
-Your task is to analyze this {message.source.value} message and provide a comprehensive summary.
+        return f"""{SUMMARY_INSTRUCTIONS}
 
 MESSAGE DETAILS:
-From: {message.sender}
-Subject: {message.subject or "N/A"}
-Content: {message.content}
-
-Provide your analysis in the following format:
-
-SUMMARY: [One concise paragraph summarizing the main message]
-
-KEY_POINTS:
-- [Key point 1]
-- [Key point 2]
-- [Key point 3]
-
-SENTIMENT: [positive/negative/neutral]
-URGENCY: [1-10 scale, where 10 is most urgent]
-
-Be concise but capture all important information."""
-
-        return prompt
+{self._format_message_details(message)}"""
 
     def _build_task_extraction_prompt(
         self, message: Message, summary: MessageSummary
@@ -236,164 +411,172 @@ Be concise but capture all important information."""
         - Priority levels
         - Task descriptions
         """
-        prompt = f"""You are the WorkEase orchestrator. Your task is to extract actionable tasks from this message.
+        return f"""{TASKS_INSTRUCTIONS}
 
 MESSAGE SUMMARY:
 {summary.summary}
 
 FULL MESSAGE CONTENT:
-{message.content}
+{_compress_content(message.content)}"""
 
-Extract all actionable tasks. For each task, provide:
-1. Clear description of what needs to be done
-2. Priority (1-10, where 10 is highest)
-3. Deadline (if mentioned, in ISO format YYYY-MM-DD)
-
-Format your response as:
-
-TASKS:
-- TASK: [description] | PRIORITY: [1-10] | DEADLINE: [YYYY-MM-DD or "none"]
-- TASK: [description] | PRIORITY: [1-10] | DEADLINE: [YYYY-MM-DD or "none"]
-
-If there are no actionable tasks, respond with:
-TASKS: none
+    def _build_combined_prompt(self, message: Message) -> str:
+        """
+        Build a single prompt asking for both the summary and the tasks.
 
-Only include clear, actionable items. Do not include vague or informational content."""
+        The message content appears once, so process_message needs one LLM
+        round-trip instead of two.
+        """
+        return f"""{ANALYSIS_INSTRUCTIONS}
 
-        return prompt
+MESSAGE DETAILS:
+{self._format_message_details(message)}"""
 
-    def _parse_summary_response(
-        self, llm_response: str, message_id: str
-    ) -> MessageSummary:
+    def _build_batched_prompt(self, messages: List[Message]) -> str:
         """
-        Parse LLM response into structured MessageSummary.
+        Build one prompt analyzing several messages at once.
 
-        Handles various LLM response formats and extracts:
-        - Summary text
-        - Key points
-        - Sentiment
-        - Urgency level
+        The instructions and output format are sent once per batch instead
+        of once per message. Each result is introduced by a numbered
+        delimiter so the response can be split back per message.
         """
-        lines = llm_response.strip().split("\n")
+        details = "\n\n".join(
+            f"--- MESSAGE {i} ---\n{self._format_message_details(message)}"
+            for i, message in enumerate(messages, 1)
+        )
+        # The message count is part of the dynamic tail, not the instructions
+        return f"""{BATCH_INSTRUCTIONS}
 
-        summary_text = ""
-        key_points = []
-        sentiment = "neutral"
-        urgency = 5
+{len(messages)} MESSAGES:
 
-        current_section = None
+{details}"""
+
+    def _format_message_details(self, message: Message) -> str:
+        """Render the per-message fields shared by the analysis prompts."""
+        return f"""Source: {message.source.value}
+From: {message.sender}
+Subject: {message.subject or "N/A"}
+Content: {_compress_content(message.content)}"""
 
-        for line in lines:
-            line = line.strip()
+    def _split_batched_response(
+        self, llm_response: str, count: int
+    ) -> List[Optional[str]]:
+        """
+        Split a batched response into per-message analyses.
 
-            if line.startswith("SUMMARY:"):
-                summary_text = line.replace("SUMMARY:", "").strip()
-                current_section = "summary"
-            elif line.startswith("KEY_POINTS:"):
-                current_section = "key_points"
-            elif line.startswith("SENTIMENT:"):
-                sentiment = line.replace("SENTIMENT:", "").strip().lower()
-                current_section = None
-            elif line.startswith("URGENCY:"):
-                urgency_str = line.replace("URGENCY:", "").strip()
-                try:
-                    urgency = int(urgency_str.split()[0])  # Handle "8 out of 10" format
-                except (ValueError, IndexError):
-                    urgency = 5  # Default
-                current_section = None
-            elif line.startswith("-") and current_section == "key_points":
-                key_points.append(line.lstrip("- ").strip())
-            elif (
-                current_section == "summary"
-                and line
-                and not line.startswith("KEY_POINTS")
-            ):
-                summary_text += " " + line
-
-        # Fallback if parsing fails
+        Returns:
+            One entry per message, None where the LLM produced no result
+        """
+        blocks: List[Optional[str]] = [None] * count
+        parts = _RESULT_DELIMITER_RE.split(llm_response)
+        # parts = [preamble, number, body, number, body, ...]
+        for number, body in zip(parts[1::2], parts[2::2]):
+            index = int(number) - 1
+            if 0 <= index < count and blocks[index] is None:
+                blocks[index] = body
+        return blocks
+
+    def _parse_json_response(
+        self, llm_response: str, message_id: str, now_iso: Optional[str] = None
+    ) -> Tuple[MessageSummary, List[Task]]:
+        """
+        Parse the LLM's JSON analysis into a summary and tasks.
+
+        Models sometimes wrap the object in prose or code fences, so the
+        outermost {...} span is parsed. If that fails, the raw response
+        becomes the summary and no tasks are extracted. The summary and
+        every task are stamped with now_iso (default: the current time).
+        """
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+
+        data: Dict[str, Any] = {}
+        start = llm_response.find("{")
+        end = llm_response.rfind("}") + 1
+        if start != -1 and end > start:
+            try:
+                parsed = loads(llm_response[start:end])
+            except ValueError:
+                parsed = None
+            if isinstance(parsed, dict):
+                data = parsed
+
+        summary_text = str(data.get("summary") or "").strip()
         if not summary_text:
+            # Fallback if parsing fails
             summary_text = (
                 llm_response[:200] + "..." if len(llm_response) > 200 else llm_response
             )
 
-        return MessageSummary(
+        key_points = data.get("key_points")
+        try:
+            urgency = int(data.get("urgency", 5))
+        except (TypeError, ValueError):
+            urgency = 5
+
+        summary = MessageSummary(
             message_id=message_id,
             summary=summary_text.strip(),
-            key_points=key_points,
-            sentiment=sentiment,
+            key_points=(
+                [str(point) for point in key_points]
+                if isinstance(key_points, list)
+                else []
+            ),
+            sentiment=str(data.get("sentiment") or "neutral").strip().lower(),
             urgency_level=urgency,
+            generated_at=now_iso,
         )
 
-    def _parse_tasks_response(self, llm_response: str, message_id: str) -> List[Task]:
-        """
-        Parse LLM response into structured Task objects.
-
-        Extracts task descriptions, priorities, and deadlines
-        from LLM's formatted response.
-        """
         tasks = []
-        lines = llm_response.strip().split("\n")
-
-        for line in lines:
-            line = line.strip()
-
-            # Check if this is a task line
-            if line.startswith("- TASK:") or line.startswith("TASK:"):
-                task_data = self._parse_single_task_line(line, message_id)
-                if task_data:
-                    tasks.append(task_data)
-
-        return tasks
-
-    def _parse_single_task_line(self, line: str, message_id: str) -> Optional[Task]:
+        task_items = data.get("tasks")
+        if isinstance(task_items, list):
+            for item in task_items:
+                if isinstance(item, dict):
+                    task = self._build_task(item, message_id, now_iso)
+                    if task:
+                        tasks.append(task)
+
+        return summary, tasks
+
+    def _build_task(
+        self, item: Dict[str, Any], message_id: str, created_at: str
+    ) -> Optional[Task]:
         """
-        Parse a single task line from LLM response.
+        Build a Task from one entry of the LLM's "tasks" list.
 
-        Format: - TASK: [desc] | PRIORITY: [1-10] | DEADLINE: [date or "none"]
+        Entries without a description are skipped; priority is clamped to
+        1-10 and placeholder deadlines ("none", "n/a") are dropped.
         """
-        try:
-            # Remove prefix
-            line = line.replace("- TASK:", "").replace("TASK:", "").strip()
-
-            # Split by |
-            parts = [p.strip() for p in line.split("|")]
-
-            if len(parts) < 2:
-                return None
+        description = str(item.get("description") or "").strip()
+        if not description:
+            return None
 
-            description = parts[0].strip()
+        try:
+            priority = max(1, min(10, int(item.get("priority", 5))))
+        except (TypeError, ValueError):
             priority = 5
-            deadline = None
 
-            # Parse priority
-            for part in parts[1:]:
-                if "PRIORITY:" in part.upper():
-                    try:
-                        priority = int(part.upper().replace("PRIORITY:", "").strip())
-                        priority = max(1, min(10, priority))  # Clamp to 1-10
-                    except ValueError:
-                        priority = 5
-                elif "DEADLINE:" in part.upper():
-                    deadline_str = part.upper().replace("DEADLINE:", "").strip()
-                    if deadline_str.lower() not in ["none", "n/a", ""]:
-                        deadline = deadline_str
-
-            # Generate task ID
-            self._task_counter += 1
-            task_id = f"task_{message_id}_{self._task_counter}"
-
-            return Task(
-                id=task_id,
-                description=description,
-                source_message_id=message_id,
-                priority=priority,
-                deadline=deadline,
-            )
-
-        except Exception as e:
-            # Log error in production
-            print(f"Warning: Failed to parse task line: {line}. Error: {e}")
-            return None
+        deadline = item.get("deadline")
+        if not isinstance(deadline, str) or deadline.strip().lower() in (
+            "none",
+            "n/a",
+            "",
+        ):
+            deadline = None
+        else:
+            deadline = deadline.strip()
+
+        # Generate task ID
+        self._task_counter += 1
+        task_id = f"task_{message_id}_{self._task_counter}"
+
+        return Task(
+            id=task_id,
+            description=description,
+            source_message_id=message_id,
+            priority=priority,
+            deadline=deadline,
+            created_at=created_at,
+        )
 
     async def _emit_message_processed_event(self, result: Dict[str, Any]) -> None:
         """
@@ -410,7 +593,9 @@ Only include clear, actionable items. Do not include vague or informational cont
         """
         Process multiple messages concurrently.
 
-        Useful for processing inbox backlog or batch operations.
+        Useful for processing inbox backlog or batch operations. Messages
+        are analyzed BATCH_SIZE per LLM call, and at most max_concurrency
+        LLM calls run at any time.
 
         Args:
             messages: List of messages to process
@@ -418,13 +603,66 @@ Only include clear, actionable items. Do not include vague or informational cont
         Returns:
             List of processing results
         """
-        tasks = [self.process_message(msg) for msg in messages]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        batches = [
+            messages[i : i + BATCH_SIZE] for i in range(0, len(messages), BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self._process_batch(batch) for batch in batches)
+        )
+
+        # Failed messages come back as None; drop them so one bad message
+        # doesn't sink the rest
+        return [result for batch in results for result in batch if result is not None]
+
+    async def _process_batch(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze a batch of messages with a single LLM call.
+
+        Messages the LLM skipped in its batched answer are retried
+        individually through process_message. If the batched call itself
+        fails, every message is retried individually, so only the messages
+        that fail on their own are dropped.
+        """
+        if len(messages) == 1:
+            return [await self._process_isolated(messages[0])]
 
-        # Filter out exceptions (in production, log them)
-        valid_results = [r for r in results if not isinstance(r, Exception)]
+        try:
+            prompt = self._build_batched_prompt(messages)
+            llm_response = await self._generate(prompt)
+            blocks = self._split_batched_response(llm_response, len(messages))
+        except Exception as e:
+            logger.warning(
+                "Batched analysis of messages %s failed, retrying individually: %s",
+                ", ".join(msg.id for msg in messages),
+                e,
+            )
+            blocks = [None] * len(messages)
 
-        return valid_results
+        results = []
+        for message, block in zip(messages, blocks):
+            if block is None:
+                results.append(await self._process_isolated(message))
+            else:
+                try:
+                    results.append(await self._finish_message(message, block))
+                except Exception as e:
+                    logger.warning(
+                        "Batched result for message %s failed, retrying: %s",
+                        message.id,
+                        e,
+                    )
+                    results.append(await self._process_isolated(message))
+        return results
+
+    async def _process_isolated(self, message: Message) -> Optional[Dict[str, Any]]:
+        """Run process_message, logging and returning None if it fails."""
+        try:
+            return await self.process_message(message)
+        except Exception as e:
+            logger.error("Failed to process message %s: %s", message.id, e)
+            return None
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,40 @@
+"""
+JSON encoding shared by the orchestrator, LLM client and stores.
+
+Uses orjson when it is installed and the standard library otherwise. Both
+paths produce the same compact, UTF-8 documents, so files and rows written
+by one can be read by the other.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Encode obj as compact JSON; non-str dict keys are converted to str."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:  # orjson.JSONEncodeError, e.g. ints beyond 64 bits
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(text: Union[str, bytes]) -> Any:
+    """
+    Decode JSON, tolerating raw newlines inside strings as LLMs emit them.
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text, strict=False)
@@ -4,13 +4,38 @@ Memory Store - SQLite-based storage for messages, summaries, and tasks.
 This implements the ContextProvider protocol for future upgradability to LangChain/RAG.
 """
 
-import json
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import aiosqlite
 
+from core.serialization import dumps
+
+# Connection settings for a local, single-process store: WAL lets reads
+# proceed during a write and makes commits append-only, and NORMAL sync is
+# durable in WAL mode short of power loss
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA busy_timeout=5000",
+)
+
+
+# Rows per multi-row INSERT, keeping bound parameters well under SQLite's limit
+_INSERT_CHUNK_ROWS = 500
+
+# INSERT ... RETURNING needs SQLite 3.35+; older libraries (e.g. Ubuntu
+# 20.04's 3.31) take the executemany path in store_tasks
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 class MemoryStore:
     """
@@ -23,9 +48,17 @@ class MemoryStore:
     - Processing metadata
     """
 
-    def __init__(self
+    def __init__(self, db_path: str = "memory/workease.db"):
         self.db_path = db_path
         self.db: Optional[aiosqlite.Connection] = None
+        # Serializes write blocks on the shared connection: a commit or
+        # rollback covers every pending statement, not just its own
+        self._write_lock = asyncio.Lock()
+        # Set inside transaction(), so writes there (and tasks they spawn)
+        # join it instead of waiting on the lock it holds
+        self._in_transaction: ContextVar[bool] = ContextVar(
+            f"memory_store_transaction_{id(self)}", default=False
+        )
 
     async def initialize(self) -> None:
         """Initialize database and create tables."""
@@ -33,8 +66,65 @@ class MemoryStore:
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
         self.db = await aiosqlite.connect(self.db_path)
+        await self._configure_connection(self.db)
         await self._create_tables()
 
+    @staticmethod
+    async def _configure_connection(db: aiosqlite.Connection) -> None:
+        """Apply row factory and performance PRAGMAs to a new connection."""
+        # Rows come back keyed by column name, so reads need no zip step
+        db.row_factory = aiosqlite.Row
+        for pragma in _PRAGMAS:
+            await db.execute(pragma)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator["MemoryStore"]:
+        """
+        Group several writes into a single commit.
+
+        Store methods called inside the block skip their own commit; the
+        block commits once on exit, or rolls back if it raises. Writes from
+        other tasks wait until the block ends, so they are neither rolled
+        back with it nor committed halfway through it. Nested blocks join
+        the enclosing transaction.
+
+        Example:
+            async with memory.transaction():
+                await memory.store_message(...)
+                summary_id = await memory.store_summary(...)
+                await memory.store_tasks(..., summary_id=summary_id)
+        """
+        if self._in_transaction.get():
+            yield self
+            return
+
+        async with self._write_lock:
+            token = self._in_transaction.set(True)
+            try:
+                yield self
+            except BaseException:
+                await self.db.rollback()
+                raise
+            else:
+                await self.db.commit()
+            finally:
+                self._in_transaction.reset(token)
+
+    @asynccontextmanager
+    async def _write(self) -> AsyncIterator[None]:
+        """Run a store method's writes as one commit, or join transaction()."""
+        if self._in_transaction.get():
+            yield
+            return
+
+        async with self._write_lock:
+            try:
+                yield
+            except BaseException:
+                await self.db.rollback()
+                raise
+            await self.db.commit()
+
     async def _create_tables(self) -> None:
         """Create database schema."""
 
@@ -102,8 +192,16 @@ class MemoryStore:
         await self.db.execute(
             "CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp)"
         )
+        # Task lookups go through (key, priority) indexes so the ORDER BY
+        # priority in get_tasks/get_pending_tasks needs no sort step
+        await self.db.execute("DROP INDEX IF EXISTS idx_tasks_status")
         await self.db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)"
+            "CREATE INDEX IF NOT EXISTS idx_tasks_status_priority "
+            "ON tasks(status, priority DESC, created_at)"
+        )
+        await self.db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_message "
+            "ON tasks(message_id, priority DESC)"
         )
         await self.db.execute(
             "CREATE INDEX IF NOT EXISTS idx_context_session ON context(session_id)"
@@ -125,37 +223,37 @@ class MemoryStore:
         if timestamp is None:
             timestamp = datetime.now().isoformat()
 
-        await self.db.execute(
-            """
-            INSERT OR REPLACE INTO messages
-            (id, source, sender, subject, content, timestamp, raw_data, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                message_id,
-                source,
-                sender,
-                subject,
-                content,
-                timestamp,
-                json.dumps(raw_data) if raw_data else None,
-                datetime.now().isoformat(),
-            ),
-        )
-        await self.db.commit()
+        async with self._write():
+            await self.db.execute(
+                """
+                INSERT OR REPLACE INTO messages
+                (id, source, sender, subject, content, timestamp, raw_data, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    message_id,
+                    source,
+                    sender,
+                    subject,
+                    content,
+                    timestamp,
+                    dumps(raw_data) if raw_data else None,
+                    datetime.now().isoformat(),
+                ),
+            )
 
     async def store_summary(
         self, message_id: str, summary: str, model_used: str = "unknown"
     ) -> int:
         """Store LLM-generated summary. Returns summary_id."""
-        cursor = await self.db.execute(
-            """
-            INSERT INTO summaries (message_id, summary, model_used, generated_at)
-            VALUES (?, ?, ?, ?)
-        """,
-            (message_id, summary, model_used, datetime.now().isoformat()),
-        )
-        await self.db.commit()
+        async with self._write():
+            cursor = await self.db.execute(
+                """
+                INSERT INTO summaries (message_id, summary, model_used, generated_at)
+                VALUES (?, ?, ?, ?)
+            """,
+                (message_id, summary, model_used, datetime.now().isoformat()),
+            )
         return cursor.lastrowid
 
     async def store_tasks(
@@ -166,28 +264,47 @@ class MemoryStore:
         priorities: Optional[List[int]] = None,
     ) -> List[int]:
         """Store extracted tasks. Returns list of task_ids."""
-        task_ids = []
-
         if priorities is None:
             priorities = [0] * len(tasks)
 
-        for task_text, priority in zip(tasks, priorities):
-            cursor = await self.db.execute(
-                """
-                INSERT INTO tasks (message_id, summary_id, task_text, priority, status, created_at)
-                VALUES (?, ?, ?, ?, 'pending', ?)
-            """,
-                (
-                    message_id,
-                    summary_id,
-                    task_text,
-                    priority,
-                    datetime.now().isoformat(),
-                ),
-            )
-            task_ids.append(cursor.lastrowid)
-
-        await self.db.commit()
+        created_at = datetime.now().isoformat()
+        rows = [
+            (message_id, summary_id, task_text, priority, created_at)
+            for task_text, priority in zip(tasks, priorities)
+        ]
+        if not rows:
+            return []
+
+        # One multi-row INSERT ... RETURNING per chunk, run together with its
+        # fetch in a single aiosqlite call: the ids come from the statement
+        # itself. Within a statement AUTOINCREMENT ids rise in row order, so
+        # sorting puts them back in input order
+        task_ids = []
+        async with self._write():
+            if not _HAS_RETURNING:
+                # The write lock keeps other writes from moving the last
+                # rowid, and one executemany assigns consecutive ids
+                await self.db.executemany(
+                    "INSERT INTO tasks "
+                    "(message_id, summary_id, task_text, priority, status, created_at) "
+                    "VALUES (?, ?, ?, ?, 'pending', ?)",
+                    rows,
+                )
+                (last_id,) = (
+                    await self.db.execute_fetchall("SELECT last_insert_rowid()")
+                )[0]
+                return list(range(last_id - len(rows) + 1, last_id + 1))
+
+            for start in range(0, len(rows), _INSERT_CHUNK_ROWS):
+                chunk = rows[start : start + _INSERT_CHUNK_ROWS]
+                placeholders = ", ".join(["(?, ?, ?, ?, 'pending', ?)"] * len(chunk))
+                returned = await self.db.execute_fetchall(
+                    "INSERT INTO tasks "
+                    "(message_id, summary_id, task_text, priority, status, created_at) "
+                    f"VALUES {placeholders} RETURNING id",
+                    [value for row in chunk for value in row],
+                )
+                task_ids.extend(sorted(row[0] for row in returned))
         return task_ids
 
     async def get_message(self, message_id: str) -> Optional[Dict[str, Any]]:
@@ -196,11 +313,7 @@ class MemoryStore:
             "SELECT * FROM messages WHERE id = ?", (message_id,)
         )
         row = await cursor.fetchone()
-
-        if row:
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, row))
-        return None
+        return dict(row) if row else None
 
     async def get_summary(self, message_id: str) -> Optional[str]:
         """Retrieve summary for a message."""
@@ -227,8 +340,7 @@ class MemoryStore:
             )
 
         rows = await cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in rows]
+        return [dict(row) for row in rows]
 
     async def get_recent_messages(
         self, limit: int = 10, source: Optional[str] = None
@@ -245,8 +357,7 @@ class MemoryStore:
             )
 
         rows = await cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in rows]
+        return [dict(row) for row in rows]
 
     async def get_pending_tasks(
         self, limit: Optional[int] = None
@@ -263,17 +374,16 @@ class MemoryStore:
             )
 
         rows = await cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in rows]
+        return [dict(row) for row in rows]
 
     async def update_task_status(self, task_id: int, status: str) -> None:
         """Update task status (pending/in_progress/completed/cancelled)."""
         completed_at = datetime.now().isoformat() if status == "completed" else None
-        await self.db.execute(
-            "UPDATE tasks SET status = ?, completed_at = ? WHERE id = ?",
-            (status, completed_at, task_id),
-        )
-        await self.db.commit()
+        async with self._write():
+            await self.db.execute(
+                "UPDATE tasks SET status = ?, completed_at = ? WHERE id = ?",
+                (status, completed_at, task_id),
+            )
 
     async def store_context(
         self,
@@ -283,20 +393,20 @@ class MemoryStore:
         session_id: Optional[str] = None,
     ) -> None:
         """Store interaction context for LLM memory."""
-        await self.db.execute(
-            """
-            INSERT INTO context (session_id, interaction_type, user_input, llm_response, timestamp)
-            VALUES (?, ?, ?, ?, ?)
-        """,
-            (
-                session_id,
-                interaction_type,
-                user_input,
-                llm_response,
-                datetime.now().isoformat(),
-            ),
-        )
-        await self.db.commit()
+        async with self._write():
+            await self.db.execute(
+                """
+                INSERT INTO context (session_id, interaction_type, user_input, llm_response, timestamp)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                (
+                    session_id,
+                    interaction_type,
+                    user_input,
+                    llm_response,
+                    datetime.now().isoformat(),
+                ),
+            )
 
     async def get_recent_context(
         self, limit: int = 10, session_id: Optional[str] = None
@@ -313,8 +423,7 @@ class MemoryStore:
             )
 
         rows = await cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in rows]
+        return [dict(row) for row in rows]
 
     async def close(self) -> None:
         """Close database connection."""
@@ -3,7 +3,11 @@ Message Processing Pipeline Demo
 
 Demonstrates the complete workflow:
 1. Mock messages arrive from Gmail/Slack agents
+2. The orchestrator has the LLM summarize them and extract tasks
+3. Results are displayed and, optionally, stored in the database
+"""
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -13,7 +17,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.llm_client import MockLLMClient, OllamaLLMClient
 from core.orchestrator import Message, MessageSource, Orchestrator
-from database.memory import MemoryStore
 
 
 class Colors:
@@ -29,16 +32,133 @@ class Colors:
     BOLD = "\033[1m"
 
 
+# Seconds to wait for the Ollama server before falling back to the mock LLM
+OLLAMA_CONNECT_TIMEOUT = 2.0
+
+# Constant pieces of the output, built once instead of on every print
+HEADER_BOLD = Colors.HEADER + Colors.BOLD
+GREEN_BOLD = Colors.GREEN + Colors.BOLD
+BLUE_BOLD = Colors.BLUE + Colors.BOLD
+RULE = f"{Colors.BOLD}{'─' * 70}{Colors.END}"
+BANNER = f"{HEADER_BOLD}{'=' * 70}{Colors.END}"
+SUCCESS_BANNER = f"{GREEN_BOLD}{'=' * 70}{Colors.END}"
+
+
+# Mock messages (simulating what Gmail/Slack agents would provide), built
+# once and shared by every run of the demo
+MOCK_MESSAGES = (
+    Message(
+        id="gmail_001",
+        source=MessageSource.GMAIL,
+        sender="boss@company.com",
+        subject="Q4 Report Due Tomorrow",
+        content="Hi team, we need the quarterly report completed and sent to me by end of day today. Please include all Q4 metrics, budget analysis, and future projections. This is urgent for tomorrow's board meeting.",
+    ),
+    Message(
+        id="slack_001",
+        source=MessageSource.SLACK,
+        sender="alice@team.slack",
+        subject=None,
+        content="Hey everyone, don't forget to update the project board with today's progress. Also, please review the PR I opened this morning - need approval before EOD.",
+    ),
+    Message(
+        id="gmail_002",
+        source=MessageSource.GMAIL,
+        sender="client@example.com",
+        subject="Re: Project Update",
+        content="Thanks for the update. Everything looks good. No action needed from our side right now. We'll reach out if we have questions.",
+    ),
+    Message(
+        id="slack_002",
+        source=MessageSource.SLACK,
+        sender="john@team.slack",
+        subject=None,
+        content="Meeting scheduled for 3pm today to discuss the new feature. Please come prepared with your status updates.",
+    ),
+)
+
+
+async def stream_results(orchestrator, messages):
+    """
+    Process messages concurrently, yielding (message, result) in input order.
+
+    Each result is yielded as soon as it and the ones before it are done, so
+    the first message can be shown while later ones are still processing.
+    """
+    pending = [
+        asyncio.create_task(orchestrator.process_message(message))
+        for message in messages
+    ]
+    try:
+        for message, task in zip(messages, pending):
+            yield message, await task
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def render(i, total, message, result):
+    """Pretty-print one processed message with a single write."""
+    lines = []
+    out = lines.append
+
+    out(RULE)
+    out(f"{BLUE_BOLD}Message {i}/{total}: {message.source.value.upper()}{Colors.END}")
+    out(f"{RULE}\n")
+
+    out(f"  📧 From: {Colors.BOLD}{message.sender}{Colors.END}")
+    if message.subject:
+        out(f"  📋 Subject: {Colors.BOLD}{message.subject}{Colors.END}")
+    out(f"  📝 Content:\n     {message.content[:150]}...")
+    out("")
+
+    # Display summary
+    summary = result["summary"]
+    out(f"  {Colors.GREEN}🤖 AI SUMMARY:{Colors.END}")
+    out(f"     {summary.summary}")
+    out("")
+
+    if summary.key_points:
+        out(f"  {Colors.CYAN}📌 KEY POINTS:{Colors.END}")
+        for point in summary.key_points:
+            out(f"     • {point}")
+        out("")
+
+    out(f"  {Colors.YELLOW}📊 ANALYSIS:{Colors.END}")
+    out(f"     Sentiment: {summary.sentiment}")
+    out(f"     Urgency: {summary.urgency_level}/10")
+    out("")
+
+    # Display extracted tasks
+    tasks = result["tasks"]
+    if tasks:
+        out(f"  {Colors.GREEN}✅ EXTRACTED TASKS ({len(tasks)}):{Colors.END}")
+        for idx, task in enumerate(tasks, 1):
+            priority_color = (
+                Colors.RED
+                if task.priority >= 8
+                else Colors.YELLOW if task.priority >= 5 else Colors.CYAN
+            )
+            out(
+                f"     {idx}. {task.description} {priority_color}[Priority: {task.priority}/10]{Colors.END}"
+            )
+            if task.deadline:
+                out(f"        ⏰ Deadline: {task.deadline}")
+    else:
+        out(f"  {Colors.CYAN}ℹ️  No actionable tasks identified{Colors.END}")
+
+    out("")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 async def demo_with_mock_llm():
     """
     Demo using mock LLM (no Ollama installation required).
     Fast and simple for testing the pipeline.
     """
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.END}")
-    print(
-        f"{Colors.HEADER}{Colors.BOLD}WorkEase Message Processing Pipeline Demo{Colors.END}"
-    )
-    print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.END}\n")
+    print(f"\n{BANNER}")
+    print(f"{HEADER_BOLD}WorkEase Message Processing Pipeline Demo{Colors.END}")
+    print(f"{BANNER}\n")
 
     print(f"{Colors.CYAN}🔧 Initializing Mock LLM (no Ollama needed)...{Colors.END}")
     llm = MockLLMClient()
@@ -50,103 +170,20 @@ async def demo_with_mock_llm():
     orchestrator = Orchestrator(llm)
     print(f"{Colors.GREEN}✓ Orchestrator ready{Colors.END}\n")
 
-    # Create mock messages (simulating what Gmail/Slack agents would provide)
-    mock_messages = [
-        Message(
-            id="gmail_001",
-            source=MessageSource.GMAIL,
-            sender="boss@company.com",
-            subject="Q4 Report Due Tomorrow",
-            content="Hi team, we need the quarterly report completed and sent to me by end of day today. Please include all Q4 metrics, budget analysis, and future projections. This is urgent for tomorrow's board meeting.",
-        ),
-        Message(
-            id="slack_001",
-            source=MessageSource.SLACK,
-            sender="alice@team.slack",
-            subject=None,
-            content="Hey everyone, don't forget to update the project board with today's progress. Also, please review the PR I opened this morning - need approval before EOD.",
-        ),
-        Message(
-            id="gmail_002",
-            source=MessageSource.GMAIL,
-            sender="client@example.com",
-            subject="Re: Project Update",
-            content="Thanks for the update. Everything looks good. No action needed from our side right now. We'll reach out if we have questions.",
-        ),
-        Message(
-            id="slack_002",
-            source=MessageSource.SLACK,
-            sender="john@team.slack",
-            subject=None,
-            content="Meeting scheduled for 3pm today to discuss the new feature. Please come prepared with your status updates.",
-        ),
-    ]
-
     print(
-        f"{Colors.YELLOW}📬 Processing {len(mock_messages)} messages...{Colors.END}\n"
+        f"{Colors.YELLOW}📬 Processing {len(MOCK_MESSAGES)} messages...{Colors.END}\n"
     )
 
-    # Process each message
-    for i, message in enumerate(mock_messages, 1):
-        print(f"{Colors.BOLD}{'─' * 70}{Colors.END}")
-        print(
-            f"{Colors.BLUE}{Colors.BOLD}Message {i}/{len(mock_messages)}: {message.source.value.upper()}{Colors.END}"
-        )
-        print(f"{Colors.BOLD}{'─' * 70}{Colors.END}\n")
-
-        print(f"  📧 From: {Colors.BOLD}{message.sender}{Colors.END}")
-        if message.subject:
-            print(f"  📋 Subject: {Colors.BOLD}{message.subject}{Colors.END}")
-        print(f"  📝 Content:\n     {message.content[:150]}...")
-        print()
-
-        # Process through orchestrator
-        result = await orchestrator.process_message(message)
-
-        # Display summary
-        summary = result["summary"]
-        print(f"  {Colors.GREEN}🤖 AI SUMMARY:{Colors.END}")
-        print(f"     {summary.summary}")
-        print()
-
-        if summary.key_points:
-            print(f"  {Colors.CYAN}📌 KEY POINTS:{Colors.END}")
-            for point in summary.key_points:
-                print(f"     • {point}")
-            print()
-
-        print(f"  {Colors.YELLOW}📊 ANALYSIS:{Colors.END}")
-        print(f"     Sentiment: {summary.sentiment}")
-        print(f"     Urgency: {summary.urgency_level}/10")
-        print()
-
-        # Display extracted tasks
-        tasks = result["tasks"]
-        if tasks:
-            print(f"  {Colors.GREEN}✅ EXTRACTED TASKS ({len(tasks)}):{Colors.END}")
-            for idx, task in enumerate(tasks, 1):
-                priority_color = (
-                    Colors.RED
-                    if task.priority >= 8
-                    else Colors.YELLOW
-                    if task.priority >= 5
-                    else Colors.CYAN
-                )
-                print(
-                    f"     {idx}. {task.description} {priority_color}[Priority: {task.priority}/10]{Colors.END}"
-                )
-                if task.deadline:
-                    print(f"        ⏰ Deadline: {task.deadline}")
-        else:
-            print(f"  {Colors.CYAN}ℹ️  No actionable tasks identified{Colors.END}")
-
-        print()
-
-    print(f"\n{Colors.GREEN}{Colors.BOLD}{'=' * 70}{Colors.END}")
-    print(
-        f"{Colors.GREEN}{Colors.BOLD}✓ All messages processed successfully!{Colors.END}"
-    )
-    print(f"{Colors.GREEN}{Colors.BOLD}{'=' * 70}{Colors.END}\n")
+    # Messages are independent, so their LLM calls overlap; each one is
+    # rendered as soon as its result is in
+    i = 0
+    async for message, result in stream_results(orchestrator, MOCK_MESSAGES):
+        i += 1
+        render(i, len(MOCK_MESSAGES), message, result)
+
+    print(f"\n{SUCCESS_BANNER}")
+    print(f"{GREEN_BOLD}✓ All messages processed successfully!{Colors.END}")
+    print(f"{SUCCESS_BANNER}\n")
 
     # Show stats
     stats = orchestrator.get_stats()
@@ -161,9 +198,9 @@ async def demo_with_ollama():
     Demo using real Ollama LLM (requires Ollama installation).
     Provides actual AI reasoning and analysis.
     """
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.END}")
-    print(f"{Colors.HEADER}{Colors.BOLD}WorkEase with Real Ollama LLM{Colors.END}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.END}\n")
+    print(f"\n{BANNER}")
+    print(f"{HEADER_BOLD}WorkEase with Real Ollama LLM{Colors.END}")
+    print(f"{BANNER}\n")
 
     print(f"{Colors.CYAN}🔧 Initializing Ollama LLM...{Colors.END}")
     print(
@@ -176,12 +213,19 @@ async def demo_with_ollama():
     llm = OllamaLLMClient(model="llama3.2:3b")
 
     try:
-        await llm.initialize()
+        # A local server answers at once; don't wait out a dead connection
+        await asyncio.wait_for(llm.initialize(), timeout=OLLAMA_CONNECT_TIMEOUT)
         print(
             f"{Colors.GREEN}✓ Ollama LLM connected (model: llama3.2:3b){Colors.END}\n"
         )
     except Exception as e:
-        print(f"{Colors.RED}✗ Failed to connect to Ollama: {e}{Colors.END}")
+        reason = (
+            f"no response within {OLLAMA_CONNECT_TIMEOUT:g}s"
+            if isinstance(e, asyncio.TimeoutError)
+            else e
+        )
+        print(f"{Colors.RED}✗ Failed to connect to Ollama: {reason}{Colors.END}")
+        await llm.close()
         print(f"\n{Colors.YELLOW}Falling back to Mock LLM...{Colors.END}\n")
         await demo_with_mock_llm()
         return
@@ -198,7 +242,7 @@ async def demo_with_ollama():
         content="Hi, we need to finalize the project proposal by Friday. Please prepare the technical architecture document and cost estimates. This is critical for the client meeting next week.",
     )
 
-    print(f"{Colors.BLUE}{Colors.BOLD}Processing message with real AI...{Colors.END}\n")
+    print(f"{BLUE_BOLD}Processing message with real AI...{Colors.END}\n")
     print(f"  From: {message.sender}")
     print(f"  Subject: {message.subject}")
     print(f"  Content: {message.content}")
@@ -224,9 +268,12 @@ async def demo_with_database():
     """
     Demo showing full pipeline including database persistence.
     """
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.END}")
-    print(f"{Colors.HEADER}{Colors.BOLD}WorkEase with Database Persistence{Colors.END}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.END}\n")
+    # Imported here so the other demos don't load the SQLite driver
+    from database.memory import MemoryStore
+
+    print(f"\n{BANNER}")
+    print(f"{HEADER_BOLD}WorkEase with Database Persistence{Colors.END}")
+    print(f"{BANNER}\n")
 
     # Initialize components
     print(f"{Colors.CYAN}🔧 Initializing components...{Colors.END}")
@@ -255,29 +302,28 @@ async def demo_with_database():
     # Process
     result = await orchestrator.process_message(message)
 
-    # Store in database
-    await memory.store_message(
-        message_id=message.id,
-        source=message.source.value,
-        sender=message.sender,
-        content=message.content,
-        subject=message.subject,
-    )
-
+    # Store in database - one transaction, one commit for all three writes
     summary = result["summary"]
-    summary_id = await memory.store_summary(
-        message_id=message.id, summary=summary.summary, model_used="mock_llm"
-    )
-
     tasks = result["tasks"]
     task_texts = [t.description for t in tasks]
     priorities = [t.priority for t in tasks]
-    await memory.store_tasks(
-        message_id=message.id,
-        tasks=task_texts,
-        summary_id=summary_id,
-        priorities=priorities,
-    )
+    async with memory.transaction():
+        await memory.store_message(
+            message_id=message.id,
+            source=message.source.value,
+            sender=message.sender,
+            content=message.content,
+            subject=message.subject,
+        )
+        summary_id = await memory.store_summary(
+            message_id=message.id, summary=summary.summary, model_used="mock_llm"
+        )
+        await memory.store_tasks(
+            message_id=message.id,
+            tasks=task_texts,
+            summary_id=summary_id,
+            priorities=priorities,
+        )
 
     print(f"{Colors.GREEN}✓ Message stored in database{Colors.END}")
     print(f"{Colors.GREEN}✓ Summary stored (ID: {summary_id}){Colors.END}")
@@ -309,20 +355,29 @@ async def demo_with_database():
     print(f"{Colors.GREEN}✓ Database closed{Colors.END}\n")
 
 
-async def main():
-    """Main entry point with menu selection"""
+# --mode values and the menu choices they stand for
+MODES = {"mock": "1", "ollama": "2", "db": "3"}
+
+
+async def main(mode=None):
+    """Main entry point; shows the menu unless a mode was given"""
     print(f"\n{Colors.BOLD}WorkEase Backend Demo{Colors.END}")
     print(f"{Colors.BOLD}{'=' * 70}{Colors.END}\n")
 
-    print("Choose demo mode:\n")
-    print(f"  {Colors.GREEN}1{Colors.END} - Mock LLM (fast, no installation required)")
-    print(
-        f"  {Colors.YELLOW}2{Colors.END} - Real Ollama LLM (requires Ollama installation)"
-    )
-    print(f"  {Colors.CYAN}3{Colors.END} - With Database Persistence")
-    print(f"  {Colors.RED}0{Colors.END} - Exit\n")
+    if mode is not None:
+        choice = MODES[mode]
+    else:
+        print("Choose demo mode:\n")
+        print(
+            f"  {Colors.GREEN}1{Colors.END} - Mock LLM (fast, no installation required)"
+        )
+        print(
+            f"  {Colors.YELLOW}2{Colors.END} - Real Ollama LLM (requires Ollama installation)"
+        )
+        print(f"  {Colors.CYAN}3{Colors.END} - With Database Persistence")
+        print(f"  {Colors.RED}0{Colors.END} - Exit\n")
 
-    choice = input("Enter choice (default=1): ").strip() or "1"
+        choice = input("Enter choice (default=1): ").strip() or "1"
 
     if choice == "1":
         await demo_with_mock_llm()
@@ -348,8 +403,23 @@ async def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="WorkEase message processing demo")
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        help="run this demo directly instead of showing the menu",
+    )
+    args = parser.parse_args()
+
+    try:
+        import uvloop
+    except ImportError:  # uvloop is optional; the default event loop works too
+        uvloop = None
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
-        asyncio.run(main())
+        asyncio.run(main(args.mode))
     except KeyboardInterrupt:
         print(f"\n\n{Colors.YELLOW}Demo interrupted by user{Colors.END}")
     except Exception as e:
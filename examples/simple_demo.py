@@ -7,12 +7,14 @@ Shows the core concept of message → summary → task extraction pipeline.
 Run: python examples/simple_demo.py
 """
 
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Message:
     """Simple message representation"""
 
@@ -23,7 +25,7 @@ class Message:
     subject: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Task:
     """Simple task representation"""
 
@@ -32,74 +34,119 @@ class Task:
     deadline: Optional[str] = None
 
 
+# Keywords that decide which tasks a message yields
+TASK_KEYWORDS = (
+    "report",
+    "urgent",
+    "eod",
+    "today",
+    "update",
+    "board",
+    "review",
+    "asap",
+    "meeting",
+)
+TASK_BITS = {keyword: 1 << bit for bit, keyword in enumerate(TASK_KEYWORDS)}
+
+
+def rule_tasks(keywords: set) -> Tuple[Task, ...]:
+    """Tasks implied by a set of lowercased keywords"""
+    tasks = []
+
+    # Check for common task patterns
+    if "report" in keywords:
+        priority = 9 if "urgent" in keywords or "eod" in keywords else 6
+        tasks.append(
+            Task(
+                description="Prepare and submit report",
+                priority=priority,
+                deadline=(
+                    "Today EOD" if "eod" in keywords or "today" in keywords else None
+                ),
+            )
+        )
+
+    if "update" in keywords and "board" in keywords:
+        tasks.append(
+            Task(description="Update project board", priority=5, deadline=None)
+        )
+
+    if "review" in keywords:
+        tasks.append(
+            Task(
+                description="Review document/PR",
+                priority=7 if "asap" in keywords else 5,
+                deadline=None,
+            )
+        )
+
+    if "meeting" in keywords:
+        tasks.append(
+            Task(description="Attend/prepare for meeting", priority=6, deadline=None)
+        )
+
+    return tuple(tasks)
+
+
+# Tasks for every combination of task keywords, indexed by keyword bitmask,
+# so extraction is one table lookup instead of a chain of keyword checks
+TASK_TABLE = tuple(
+    rule_tasks({keyword for keyword, bit in TASK_BITS.items() if mask & bit})
+    for mask in range(1 << len(TASK_KEYWORDS))
+)
+
+
 class SimpleLLM:
     """
     Mock LLM that simulates AI processing.
     In real implementation, this would call Ollama or OpenAI API.
     """
 
-    def summarize(self, message: Message) -> str:
+    # Every keyword the rules below look at, found in one scan. The lookahead
+    # reports each match position without consuming it, so keywords that
+    # overlap in the text are all found, like separate `in` checks would
+    KEYWORDS = re.compile(
+        r"(?=(report|urgent|eod|meeting|update|board|review|thanks|no action"
+        r"|asap|today))",
+        re.IGNORECASE,
+    )
+
+    def find_keywords(self, message: Message) -> set:
+        """Lowercased keywords present in the message content"""
+        return {
+            match.group(1).lower() for match in self.KEYWORDS.finditer(message.content)
+        }
+
+    def summarize(self, message: Message, keywords: Optional[set] = None) -> str:
         """Generate a simple summary based on keywords"""
-        content_lower = message.content.lower()
+        if keywords is None:
+            keywords = self.find_keywords(message)
 
         # Simple keyword-based summarization
-        if (
-            "report" in content_lower
-            and "urgent" in content_lower
-            or "eod" in content_lower
-        ):
+        if "report" in keywords and "urgent" in keywords or "eod" in keywords:
             return (
                 f"{message.sender} requests urgent completion of report by end of day."
             )
-        elif "meeting" in content_lower:
+        elif "meeting" in keywords:
             return f"{message.sender} scheduled a meeting, review required."
-        elif "update" in content_lower:
+        elif "update" in keywords:
             return f"{message.sender} requests project updates."
-        elif "thanks" in content_lower or "no action" in content_lower:
+        elif "thanks" in keywords or "no action" in keywords:
             return f"{message.sender} acknowledged, no action required."
         else:
             return f"{message.sender} sent a message requiring attention."
 
-    def extract_tasks(self, message: Message) -> List[Task]:
+    def extract_tasks(
+        self, message: Message, keywords: Optional[set] = None
+    ) -> Tuple[Task, ...]:
         """Extract tasks from message using keyword matching"""
-        content_lower = message.content.lower()
-        tasks = []
-
-        # Check for common task patterns
-        if "report" in content_lower:
-            priority = 9 if "urgent" in content_lower or "eod" in content_lower else 6
-            tasks.append(
-                Task(
-                    description="Prepare and submit report",
-                    priority=priority,
-                    deadline="Today EOD"
-                    if "eod" in content_lower or "today" in content_lower
-                    else None,
-                )
-            )
-
-        if "update" in content_lower and "board" in content_lower:
-            tasks.append(
-                Task(description="Update project board", priority=5, deadline=None)
-            )
-
-        if "review" in content_lower:
-            tasks.append(
-                Task(
-                    description="Review document/PR",
-                    priority=7 if "asap" in content_lower else 5,
-                    deadline=None,
-                )
-            )
-
-        if "meeting" in content_lower:
-            tasks.append(
-                Task(
-                    description="Attend/prepare for meeting", priority=6, deadline=None
-                )
-            )
-
-        return tasks
+        if keywords is None:
+            keywords = self.find_keywords(message)
+        mask = 0
+        for keyword in keywords:
+            mask |= TASK_BITS.get(keyword, 0)
+        # Tuple of frozen tasks, safe to share between messages as is
+        return TASK_TABLE[mask]
 
 
 class SimpleOrchestrator:
@@ -108,17 +155,36 @@ class SimpleOrchestrator:
     Real implementation would have LLM integration, event bus, database, etc.
     """
 
+    # Most recent (summary, tasks) results kept for repeated content
+    CACHE_SIZE = 256
+
     def __init__(self, llm: SimpleLLM):
         self.llm = llm
         self.processed_count = 0
+        self._cache: OrderedDict = OrderedDict()
+
+    def _analyze(self, message: Message) -> Tuple[str, Tuple[Task, ...]]:
+        """Summary and tasks for a message, reused for repeated content"""
+        # The summary names the sender, so the sender is part of the key
+        key = (message.sender, message.content)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        # One keyword scan of the content serves both steps
+        keywords = self.llm.find_keywords(message)
+        summary = self.llm.summarize(message, keywords)
+        tasks = self.llm.extract_tasks(message, keywords)
+        self._cache[key] = (summary, tasks)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return summary, tasks
 
     def process_message(self, message: Message) -> dict:
         """Process a message through the pipeline"""
-        # Step 1: Generate summary
-        summary = self.llm.summarize(message)
-
-        # Step 2: Extract tasks
-        tasks = self.llm.extract_tasks(message)
+        # Step 1 + 2: Generate summary and extract tasks
+        summary, tasks = self._analyze(message)
 
         self.processed_count += 1
 
@@ -248,7 +314,8 @@ def main():
 
     print("📚 For full feature demo with real LLM:")
     print("   1. Install dependencies: pip install -r requirements.txt")
-    print("   2. Install Ollama
+    print("   2. Install Ollama: curl -fsSL https://ollama.com/install.sh | sh")
+    print("   3. Run: python examples/message_processing_demo.py")
     print()
 
 
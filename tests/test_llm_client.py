@@ -0,0 +1,60 @@
+"""
+Tests for the LLM client's intent cache.
+"""
+
+import asyncio
+import json
+
+from core.llm_client import OllamaLLMClient
+
+
+class _ScriptedOllamaClient(OllamaLLMClient):
+    """Ollama client that answers from a script instead of the server."""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def _generate(self, prompt: str, system_prompt: str = "") -> str:
+        self.calls += 1
+        return json.dumps(self.responses.pop(0))
+
+
+def _priority_intent(priority):
+    return {
+        "action": "update",
+        "target": "task",
+        "parameters": {"priority": priority},
+        "confidence": 0.9,
+    }
+
+
+def test_cached_intent_reused_for_same_kind_of_slot():
+    client = _ScriptedOllamaClient([_priority_intent(5)])
+
+    async def run():
+        await client.understand_intent("set task priority to 5")
+        return await client.understand_intent("set task priority to 8")
+
+    intent = asyncio.run(run())
+    assert intent.parameters == {"priority": 8}
+    assert client.calls == 1
+
+
+def test_cached_intent_with_other_kind_of_slot_asks_llm():
+    client = _ScriptedOllamaClient(
+        [_priority_intent(5), _priority_intent(7.5), _priority_intent("high")]
+    )
+
+    async def run():
+        await client.understand_intent("set task priority to 5")
+        decimal = await client.understand_intent("set task priority to 7.5")
+        await client.understand_intent("set task priority to 5")
+        quoted = await client.understand_intent('set task priority to "high"')
+        return decimal, quoted
+
+    decimal, quoted = asyncio.run(run())
+    assert decimal.parameters == {"priority": 7.5}
+    assert quoted.parameters == {"priority": "high"}
+    assert client.calls == 3